@@ -32,7 +32,7 @@ import fcntl
 from datetime import datetime
 from pathlib import Path
 from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
-from utils import list_audio_inputs, list_video_inputs, find_usb_storage, move_file_to_usb, copy_executables_to_usb, DEFAULT_SETTINGS, SETTINGS_FILE, STREAMER_DATA_DIR,HEARTBEAT_FILE, is_streaming, is_recording, is_pid_running, STREAM_PIDFILE, is_gps_tracking, get_gps_tracking_status, load_settings, save_settings, get_hardwareid, get_app_version, get_active_recording_info, add_files_from_path, load_wifi_settings, save_wifi_settings, get_wifi_mode_status, reset_modem_at_command, load_cellular_settings, save_cellular_settings, get_cellular_status, get_streamer_settings
+from utils import list_audio_inputs, list_video_inputs, find_usb_storage, move_file_to_usb, copy_executables_to_usb, DEFAULT_SETTINGS, SETTINGS_FILE, STREAMER_DATA_DIR,HEARTBEAT_FILE, is_streaming, is_recording, is_pid_running, STREAM_PIDFILE, is_gps_tracking, get_gps_tracking_status, load_settings, save_settings, get_hardwareid, get_app_version, get_active_recording_info, add_files_from_path, load_wifi_settings, save_wifi_settings, get_wifi_mode_status, invalidate_wifi_status_cache, reset_modem_at_command, load_cellular_settings, save_cellular_settings, get_cellular_status, get_streamer_settings
 
 # Use pymediainfo for fast video duration extraction - now imported in utils.py
 #this is a test
@@ -1350,7 +1350,9 @@ def system_settings_wifi():
         # which sets ethernet priority to 100 (highest), so we don't modify it here
         
     except Exception as e:
+        invalidate_wifi_status_cache()
         return jsonify({'success': False, 'error': f'Failed to configure WiFi with NetworkManager: {e}'})
+    invalidate_wifi_status_cache()
     return jsonify({'success': True})
 
 def configure_wifi_hotspot(ssid, password, channel=36, ip_address="192.168.4.1"):
@@ -1737,6 +1739,7 @@ def system_settings_wifi_mode():
         
         # Configure hotspot
         success, message = configure_wifi_hotspot(ssid, password, channel, ip_address)
+        invalidate_wifi_status_cache()
         
         if success:
             return jsonify({'success': True, 'message': f'Hotspot "{ssid}" created successfully'})
@@ -1747,6 +1750,7 @@ def system_settings_wifi_mode():
         # No need to update wifi_mode in settings since it's determined from hardware
         # Just switch to client mode
         success, message = configure_wifi_client()
+        invalidate_wifi_status_cache()
         
         if success:
             return jsonify({'success': True, 'message': 'Switched to WiFi client mode'})
@@ -528,6 +528,12 @@ sudo apt-get install python3-werkzeug -y
 sudo apt-get install gunicorn python3-gevent python3-requests-toolbelt -y
 sudo apt-get install python3-pymediainfo -y
 sudo apt-get install mediainfo -y
+# libnm GObject bindings for querying NetworkManager over D-Bus (WiFi status)
+sudo apt-get install python3-gi gir1.2-nm-1.0 -y
+# Optional fast JSON library for settings I/O (utils.py falls back to stdlib json)
+sudo apt-get install python3-orjson -y || echo "python3-orjson not available, using stdlib json"
+# udev event monitoring for the live USB storage device cache (utils.py falls back to sysfs scans)
+sudo apt-get install python3-pyudev -y
 
 # GPS Tracker dependencies (using direct NMEA parsing)
 
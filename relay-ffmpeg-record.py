@@ -184,7 +184,7 @@ def main():
         except Exception as e:
             print(f"Warning: Could not write active PID file: {e}")
         proc.wait()
-        cleanup_pidfile(ACTIVE_PIDFILE, sync_usb=True)
+        cleanup_pidfile(ACTIVE_PIDFILE, sync_usb=True, sync_path=usb_mount)
         
         # Post-process the recording to ensure proper MP4 structure with faststart
         postprocess_recording(recording_file)
@@ -1,4 +1,5 @@
 import subprocess
+import sys
 import re
 import os
 import json
@@ -6,12 +7,21 @@ import psutil
 import time
 import math
 import socket
-import glob
+import random
 import logging
 import serial
 import fcntl
 import shutil
+import errno
+import tempfile
+import stat
+import struct
+import ctypes
 import hashlib
+import functools
+import threading
+import concurrent.futures
+from collections import ChainMap, deque
 from datetime import datetime
 from typing import Optional
 
@@ -21,17 +31,81 @@ try:
 except ImportError:
     MediaInfo = None
 
+# Use NumPy for batched GPS distance calculations when available
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Use BLAKE3 for file-identity checksums when available (SIMD-accelerated; falls back to hashlib MD5).
+# Only used to compare file contents, never for anything security-relevant.
+try:
+    from blake3 import blake3 as _file_hash
+except ImportError:
+    _file_hash = hashlib.md5
+
 # Additional imports for server communication
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared HTTP session so repeated server polls reuse the keep-alive TLS connection.
+# Retries stay disabled here - callers such as get_streamer_settings run their own retry loop.
+_http_session = requests.Session()
+_http_session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=2,
+                                            max_retries=Retry(total=0, connect=0)))
+_http_session.headers.update({'Accept-Encoding': 'gzip'})
+
+# Use orjson for settings file I/O when available (falls back to the stdlib json module)
+try:
+    import orjson
+
+    def _jload(fp):
+        """Parse JSON from a binary file object"""
+        return orjson.loads(fp.read())
+
+    def _jdumps(obj):
+        """Serialize obj to indented JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    orjson = None
+
+    def _jload(fp):
+        """Parse JSON from a binary file object"""
+        return json.load(fp)
+
+    def _jdumps(obj):
+        """Serialize obj to indented JSON bytes"""
+        return json.dumps(obj, indent=2).encode()
+
+# Use inotify to invalidate the settings cache when available (falls back to mtime polling)
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+# Use libnm (NetworkManager over D-Bus) for WiFi status queries when available
+try:
+    import gi
+    gi.require_version('NM', '1.0')
+    from gi.repository import NM
+except (ImportError, ValueError):
+    NM = None
+
+# Use pyudev to track USB storage partitions from udev events when available (falls back to sysfs scans)
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
 
 def generate_gps_track_id() -> str:
     """Generate a unique GPS track ID based on current timestamp"""
     return str(int(time.time()))
 
-def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance between two GPS coordinates using Haversine formula (returns meters)"""
+def _haversine(lat1, lon1, lat2, lon2):
+    """Haversine distance in meters (plain math.* so numba can compile it unchanged)"""
     # Earth radius in meters
-    R = 6371000
+    R = 6371000.0
     
     # Convert latitude and longitude to radians
     lat1_rad = math.radians(lat1)
@@ -45,8 +119,46 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
     
     # Distance in meters
-    distance = R * c
-    return distance
+    return R * c
+
+# Optionally JIT-compile the Haversine with numba for per-sample GPS loops.
+# Opt-in via RPI_STREAMER_NUMBA=1 so installs without numba (e.g. Pi Zero) are unaffected.
+if os.environ.get('RPI_STREAMER_NUMBA') == '1':
+    try:
+        from numba import njit
+        _haversine_jit = njit(cache=True, fastmath=True)(_haversine)
+        # Compile now so the first real GPS sample doesn't pay the JIT cost;
+        # only switch over once compilation has succeeded
+        _haversine_jit(0.0, 0.0, 0.0, 0.0)
+        _haversine = _haversine_jit
+        del _haversine_jit
+    except Exception:
+        pass
+
+def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate distance between two GPS coordinates using Haversine formula (returns meters)"""
+    return float(_haversine(lat1, lon1, lat2, lon2))
+
+def calculate_distances(lat1, lon1, lat2, lon2):
+    """
+    Vectorized Haversine distance (meters) between arrays of GPS coordinates.
+    Accepts sequences or NumPy arrays of equal shape and returns an array of distances.
+    Falls back to a list of calculate_distance results if NumPy is not installed.
+    """
+    if np is None:
+        return [calculate_distance(a, b, c, d) for a, b, c, d in zip(lat1, lon1, lat2, lon2)]
+    
+    lat1 = np.asarray(lat1, dtype=np.float64)
+    lon1 = np.asarray(lon1, dtype=np.float64)
+    lat2 = np.asarray(lat2, dtype=np.float64)
+    lon2 = np.asarray(lon2, dtype=np.float64)
+    
+    delta_lat = np.radians(lat2 - lat1)
+    delta_lon = np.radians(lon2 - lon1)
+    a = (np.sin(delta_lat * 0.5) ** 2 +
+         np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) * np.sin(delta_lon * 0.5) ** 2)
+    # arcsin(sqrt(a)) equals atan2(sqrt(a), sqrt(1 - a)) for a in [0, 1]; clip guards rounding
+    return 6371000.0 * 2.0 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
 
 # Settings constants and defaults
 STREAMER_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'streamerData'))
@@ -54,12 +166,24 @@ SETTINGS_FILE = os.path.join(STREAMER_DATA_DIR, 'settings.json')
 STREAM_PIDFILE = "/tmp/relay-ffmpeg-webcam.pid"
 HEARTBEAT_FILE = "/tmp/rpi_streamer_heartbeat.json"
 
+class _HostnameTranslation(dict):
+    """str.translate table mapping every character except ASCII letters, digits and '-' to '-'"""
+    _KEEP = frozenset(map(ord, 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-'))
+
+    def __missing__(self, codepoint):
+        if codepoint in self._KEEP:
+            raise LookupError(codepoint)  # leave the character unchanged
+        return '-'
+
+_HOSTNAME_TT = _HostnameTranslation()
+
+@functools.lru_cache(maxsize=1)
 def get_default_hotspot_ssid():
-    """Get the system hostname to use as default hotspot SSID"""
+    """Get the system hostname to use as default hotspot SSID (memoized, the hostname is set at install time)"""
     try:
         hostname = socket.gethostname()
         # Clean up hostname to be WiFi-safe (alphanumeric and hyphens only)
-        clean_hostname = re.sub(r'[^a-zA-Z0-9-]', '-', hostname)
+        clean_hostname = hostname.translate(_HOSTNAME_TT)
         return clean_hostname if clean_hostname else "RPI-Streamer"
     except:
         return "RPI-Streamer"
@@ -96,6 +220,58 @@ DEFAULT_SETTINGS = {
     "xplane_bind_address": "0.0.0.0"
 }
 
+def _apply_server_settings(logger, settings_dict, response):
+    """
+    Merge a streamer-settings server response into settings_dict and save it if anything changed.
+    Returns (True, settings_dict, response_data) for get_streamer_settings.
+    """
+    # Try to parse as JSON first
+    try:
+        json_data = response.json()
+        logger.debug(f"Parsed JSON response: {json_data}")
+        
+        # Update settings with flight parameters from response
+        if isinstance(json_data, dict):
+            # Handle JSON response - loop through all remote settings and override local ones
+            settings_updated = False
+            for key, value in json_data.items():
+                if key in settings_dict:
+                    # Only update if the value is different
+                    if settings_dict[key] != value:
+                        old_value = settings_dict[key]
+                        settings_dict[key] = value
+                        logger.info(f"Updated {key}: {old_value} -> {value}")
+                        settings_updated = True
+                else:
+                    # Add new setting if it doesn't exist locally
+                    settings_dict[key] = value
+                    logger.info(f"Added new setting {key}: {value}")
+                    settings_updated = True
+
+            # Log changes
+            if settings_updated:
+                logger.info("Flight parameters updated from server")
+                # Save the updated settings to file
+                try:
+                    save_settings(settings_dict)
+                    logger.info("Updated settings saved to file")
+                except Exception as save_error:
+                    logger.error(f"Failed to save updated settings: {save_error}")
+            else:
+                logger.info("No setting changes needed - all values already match")
+        else:
+            logger.warning(f"Flight parameters response format not recognized: {type(json_data)}")
+        
+        logger.info("Successfully retrieved streamer settings from server")
+        return True, settings_dict, json_data
+        
+    except json.JSONDecodeError:
+        logger.warning("Response is not valid JSON, returning as text")
+        # If not JSON, return the text content
+        result = {"text_response": response.text}
+        logger.info("Successfully retrieved streamer settings from server (text format)")
+        return True, settings_dict, result
+
 def get_streamer_settings(logger, poll_until_success=False, poll_interval=30):
     """
     Load local settings, retrieve streamer settings from the server, and update local settings.
@@ -110,7 +286,8 @@ def get_streamer_settings(logger, poll_until_success=False, poll_interval=30):
     Args:
         logger: Logger instance for logging messages
         poll_until_success (bool): If True, will keep polling until successful
-        poll_interval (int): Seconds to wait between polling attempts
+        poll_interval (int): Initial seconds to wait between polling attempts; the wait doubles
+            on each failure (with jitter) up to 10 minutes
         
     Returns:
         tuple: (success, updated_settings_dict, response_data)
@@ -135,58 +312,14 @@ def get_streamer_settings(logger, poll_until_success=False, poll_interval=30):
                 logger.info(f"Retrieving streamer settings for hardware ID: {hardwareid}")
             logger.debug(f"Request URL: {url}")
 
-            response = requests.get(url, timeout=10)
+            # Use the shared keep-alive session with separate connect/read timeouts
+            response = _http_session.get(url, timeout=(3.05, 10))
             response.raise_for_status()  # Raises an HTTPError for bad responses
 
             logger.info(f"Response status: {response.status_code}")
             logger.debug(f"Response content: {response.text[:500]}...")  # First 500 chars for debugging
 
-            # Try to parse as JSON first
-            try:
-                json_data = response.json()
-                logger.debug(f"Parsed JSON response: {json_data}")
-                
-                # Update settings with flight parameters from response
-                if isinstance(json_data, dict):
-                    # Handle JSON response - loop through all remote settings and override local ones
-                    settings_updated = False
-                    for key, value in json_data.items():
-                        if key in settings_dict:
-                            # Only update if the value is different
-                            if settings_dict[key] != value:
-                                old_value = settings_dict[key]
-                                settings_dict[key] = value
-                                logger.info(f"Updated {key}: {old_value} -> {value}")
-                                settings_updated = True
-                        else:
-                            # Add new setting if it doesn't exist locally
-                            settings_dict[key] = value
-                            logger.info(f"Added new setting {key}: {value}")
-                            settings_updated = True
-
-                    # Log changes
-                    if settings_updated:
-                        logger.info("Flight parameters updated from server")
-                        # Save the updated settings to file
-                        try:
-                            save_settings(settings_dict)
-                            logger.info("Updated settings saved to file")
-                        except Exception as save_error:
-                            logger.error(f"Failed to save updated settings: {save_error}")
-                    else:
-                        logger.info("No setting changes needed - all values already match")
-                else:
-                    logger.warning(f"Flight parameters response format not recognized: {type(json_data)}")
-                
-                logger.info("Successfully retrieved streamer settings from server")
-                return True, settings_dict, json_data
-                
-            except json.JSONDecodeError:
-                logger.warning("Response is not valid JSON, returning as text")
-                # If not JSON, return the text content
-                result = {"text_response": response.text}
-                logger.info("Successfully retrieved streamer settings from server (text format)")
-                return True, settings_dict, result
+            return _apply_server_settings(logger, settings_dict, response)
 
         except Exception as e:
             logger.warning(f"Failed to retrieve streamer settings (attempt {attempt}): {e}")
@@ -195,16 +328,76 @@ def get_streamer_settings(logger, poll_until_success=False, poll_interval=30):
                 logger.exception(f"Unexpected error in get_streamer_settings: {e}")
                 return False, settings_dict, None
             
-            # If polling, wait and try again
-            logger.info(f"Will retry in {poll_interval} seconds...")
-            time.sleep(poll_interval)
+            # If polling, back off exponentially (capped at 10 minutes) with jitter and try again
+            delay = min(poll_interval * 2 ** min(attempt - 1, 5), 600)
+            logger.info(f"Will retry in {delay} seconds...")
+            time.sleep(delay + random.uniform(0, delay * 0.1))
             attempt += 1
 
+def _ttl_cache(ttl):
+    """
+    Decorator caching a no-argument function's result for ttl seconds.
+    The wrapper exposes cache_clear() to force the next call to recompute.
+    """
+    def decorator(func):
+        cache = {'t': 0.0, 'v': None}
+
+        @functools.wraps(func)
+        def wrapper():
+            now = time.monotonic()
+            if cache['v'] is None or now - cache['t'] >= ttl:
+                cache['v'] = func()
+                cache['t'] = now
+            return list(cache['v'])
+
+        def cache_clear():
+            cache['v'] = None
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+# Card lines in /proc/asound/cards look like: " 1 [Device         ]: USB-Audio - USB Audio Device"
+_ASOUND_CARD_RE = re.compile(r'^\s*(\d+) \[[^\]]*\]: \S+ - (.+)$', re.M)
+
+def _list_audio_inputs_procfs():
+    """
+    Read ALSA capture devices from /proc/asound without forking arecord.
+    Returns a list like list_audio_inputs(), or None if /proc/asound is unavailable.
+    """
+    try:
+        with open('/proc/asound/cards', 'r') as f:
+            cards_text = f.read()
+        with open('/proc/asound/pcm', 'r') as f:
+            pcm_text = f.read()
+    except (IOError, OSError):
+        return None
+    
+    # One pass over the whole file instead of matching line by line
+    card_names = {int(num): name.strip() for num, name in _ASOUND_CARD_RE.findall(cards_text)}
+    
+    # PCM lines look like: "01-00: USB Audio : USB Audio : playback 1 : capture 1"
+    devices = []
+    for line in pcm_text.splitlines():
+        pcm_id, _, rest = line.partition(':')
+        if 'capture' not in rest or '-' not in pcm_id:
+            continue
+        cardnum, devnum = (int(x) for x in pcm_id.split('-', 1))
+        device_str = f'hw:{cardnum},{devnum}'
+        label = f'{card_names.get(cardnum, f"card {cardnum}")} ({device_str})'
+        devices.append({"id": device_str, "label": label})
+    return devices
+
+@_ttl_cache(10)
 def list_audio_inputs():
     """
     Returns a list of dicts: {"id": device_str, "label": friendly_name}
     where device_str is e.g. 'hw:1,0' and friendly_name is e.g. 'USB Audio Device (hw:1,0)'.
+    Reads /proc/asound directly (arecord -l as fallback); results are cached for 10 seconds.
     """
+    devices = _list_audio_inputs_procfs()
+    if devices is not None:
+        return devices
     try:
         result = subprocess.run(['arecord', '-l'], capture_output=True, text=True)
         devices = []
@@ -226,112 +419,239 @@ def list_audio_inputs():
     except Exception:
         return []
 
+# V4L2 VIDIOC_QUERYCAP ioctl (struct v4l2_capability from linux/videodev2.h)
+_V4L2_CAPABILITY = struct.Struct('16s32s32sIII12x')
+_VIDIOC_QUERYCAP = (2 << 30) | (_V4L2_CAPABILITY.size << 16) | (ord('V') << 8) | 0
+_V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+_V4L2_CAP_VIDEO_M2M_MPLANE = 0x00004000
+_V4L2_CAP_VIDEO_M2M = 0x00008000
+_V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+# Raspberry Pi platform drivers whose nodes report VIDEO_CAPTURE but are ISP/codec
+# pipeline stages (e.g. bcm2835-isp registers /dev/video14, 15, 21 and 22), not cameras
+_PLATFORM_V4L2_DRIVERS = frozenset(('bcm2835-isp', 'bcm2835-codec', 'pispbe', 'rpivid', 'rpi-hevc-dec'))
+
+def _v4l2_querycap(dev):
+    """Return (driver, card_name, device_caps) for a V4L2 device node, or None if the ioctl fails"""
+    try:
+        fd = os.open(dev, os.O_RDWR | os.O_NONBLOCK)
+    except OSError:
+        return None
+    try:
+        buf = bytearray(_V4L2_CAPABILITY.size)
+        fcntl.ioctl(fd, _VIDIOC_QUERYCAP, buf, True)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+    driver, card, _bus_info, _version, capabilities, device_caps = _V4L2_CAPABILITY.unpack(buf)
+    # device_caps describes this particular node; capabilities covers the whole physical device
+    if capabilities & _V4L2_CAP_DEVICE_CAPS:
+        capabilities = device_caps
+    return (driver.split(b'\0', 1)[0].decode(errors='replace'),
+            card.split(b'\0', 1)[0].decode(errors='replace'), capabilities)
+
+@_ttl_cache(10)
 def list_video_inputs():
     """
     Returns a list of dicts: {"id": device_path, "label": friendly_name}
     where device_path is e.g. '/dev/video0' and friendly_name is a short name plus the device string.
     Lists all /dev/video* devices that are actual video capture interfaces, filtering out duplicates.
+    Capture support is read with VIDIOC_QUERYCAP (sysfs name as fallback); results are cached for 10 seconds.
     """
     devices = []
     seen_names = set()
     
-    for i in range(10):
-        dev = f'/dev/video{i}'
-        if os.path.exists(dev):
-            name_path = f'/sys/class/video4linux/video{i}/name'
+    # Enumerate only the nodes that exist from sysfs, in numeric order
+    try:
+        with os.scandir('/sys/class/video4linux') as it:
+            entries = [entry for entry in it if entry.name.startswith('video') and entry.name[5:].isdigit()]
+    except FileNotFoundError:
+        return devices
+    entries.sort(key=lambda entry: int(entry.name[5:]))
+    
+    for entry in entries:
+        node = entry.name
+        dev = f'/dev/{node}'
+        if not os.path.exists(dev):
+            continue
+        
+        info = _v4l2_querycap(dev)
+        if info is not None:
+            driver, name, caps = info
+            # Keep only real capture nodes (drops metadata and mem-to-mem codec nodes)
+            if not caps & _V4L2_CAP_VIDEO_CAPTURE or caps & (_V4L2_CAP_VIDEO_M2M | _V4L2_CAP_VIDEO_M2M_MPLANE):
+                continue
+        else:
+            driver = os.path.basename(os.path.realpath(f'{entry.path}/device/driver'))
+        # Skip the Pi's ISP and codec pipeline nodes
+        if driver in _PLATFORM_V4L2_DRIVERS:
+            continue
+        if info is None:
             try:
-                with open(name_path, 'r') as f:
+                with open(f'{entry.path}/name', 'r') as f:
                     name = f.read().strip()
-                    # Only use the part before ':' if present
-                    short = name.split(':', 1)[0].strip() if ':' in name else name
-                    
-                    # Skip if we've already seen this device name
-                    if short in seen_names:
-                        continue
-                    
-                    # Filter out non-video interfaces (metadata, control, etc.)
-                    name_lower = name.lower()
-                    if ('metadata' in name_lower or 
-                        'control' in name_lower or 
-                        'output' in name_lower):
-                        continue
-                    
-                    if not short:
-                        short = f'video{i}'
-                    
-                    label = f'{short} ({dev})'
-                    devices.append({"id": dev, "label": label})
-                    seen_names.add(short)
-                    
             except Exception:
                 # If we can't read the name, include it as a fallback
-                label = f'video{i} ({dev})'
+                label = f'{node} ({dev})'
                 if label not in [d["label"] for d in devices]:
                     devices.append({"id": dev, "label": label})
+                continue
+            
+            # Filter out non-video interfaces (metadata, control, etc.)
+            name_lower = name.lower()
+            if ('metadata' in name_lower or 
+                'control' in name_lower or 
+                'output' in name_lower):
+                continue
+        
+        # Only use the part before ':' if present
+        short = name.split(':', 1)[0].strip() if ':' in name else name
+        
+        # Skip if we've already seen this device name
+        if short in seen_names:
+            continue
+        
+        if not short:
+            short = node
+        
+        label = f'{short} ({dev})'
+        devices.append({"id": dev, "label": label})
+        seen_names.add(short)
                     
     return devices
 
 # Settings cache to avoid re-reading file on every call
 _settings_cache = None
 _settings_cache_mtime = None
+# INotify instance watching STREAMER_DATA_DIR (None = not set up yet, False = unavailable)
+_settings_inotify = None
 
-def get_setting(key):
+def _settings_file_changed():
     """
-    Load a single setting from the settings.json file in ../streamerData.
-    Uses centralized defaults if the key is not found.
-    Caches settings in memory and only re-reads file when modified.
+    Return True if settings.json may have changed since the last call.
+    Uses inotify events on the data directory when available, so no stat() is needed
+    per lookup; otherwise falls back to comparing the file's mtime.
     """
-    global _settings_cache, _settings_cache_mtime
+    global _settings_inotify, _settings_cache_mtime
+    
+    if _settings_inotify is None:
+        _settings_inotify = False
+        if INotify is not None:
+            try:
+                watcher = INotify()
+                watcher.add_watch(STREAMER_DATA_DIR, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO |
+                                  inotify_flags.MOVED_FROM | inotify_flags.DELETE)
+                _settings_inotify = watcher
+            except OSError:
+                # Data directory missing or inotify not supported - use mtime polling
+                pass
     
+    if _settings_inotify:
+        changed = False
+        for event in _settings_inotify.read(timeout=0):
+            if event.name == os.path.basename(SETTINGS_FILE) or event.mask & inotify_flags.Q_OVERFLOW:
+                changed = True
+        return changed
+    
+    # One stat per lookup; mtime_ns plus size catches rewrites within the same timestamp tick
     try:
-        # Check if we need to reload the file
+        st = os.stat(SETTINGS_FILE)
+        current_mtime = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
         current_mtime = None
-        if os.path.exists(SETTINGS_FILE):
-            current_mtime = os.path.getmtime(SETTINGS_FILE)
-        
-        # Load from cache if file hasn't changed
-        if (_settings_cache is not None and 
-            current_mtime == _settings_cache_mtime):
-            # Use cached settings
-            if key in _settings_cache:
-                return _settings_cache[key]
-            return DEFAULT_SETTINGS.get(key, None)
-        
-        # File changed or no cache yet - reload
-        if os.path.exists(SETTINGS_FILE):
-            try:
-                with open(SETTINGS_FILE, 'r') as f:
+    if current_mtime != _settings_cache_mtime:
+        _settings_cache_mtime = current_mtime
+        return True
+    return False
+
+def _open_noatime(path):
+    """
+    Open path for binary reading without updating its access time on the SD card.
+    O_NOATIME is only allowed for the file's owner (or root), so fall back to a plain open otherwise.
+    """
+    flags = os.O_RDONLY | getattr(os, 'O_NOATIME', 0)
+    try:
+        fd = os.open(path, flags)
+    except PermissionError:
+        fd = os.open(path, os.O_RDONLY)
+    return os.fdopen(fd, 'rb')
+
+def _refresh_settings_cache():
+    """
+    Reload settings.json into the in-memory cache if it changed since the last load.
+    Returns the cached settings dict, or None if the file could not be read.
+    """
+    global _settings_cache
+    
+    try:
+        # Reload if the file changed or there is no cache yet
+        if _settings_file_changed() or _settings_cache is None:
+            if os.path.exists(SETTINGS_FILE):
+                with _open_noatime(SETTINGS_FILE) as f:
                     # Acquire shared lock for reading
                     fcntl.flock(f.fileno(), fcntl.LOCK_SH)
                     try:
-                        _settings_cache = json.load(f)
-                        _settings_cache_mtime = current_mtime
+                        _settings_cache = _jload(f)
                     finally:
                         # Release lock
                         fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-            except (OSError, IOError):
-                # Do not attempt to read without lock - use empty cache on lock error
+            else:
+                # File doesn't exist - use empty cache
                 _settings_cache = {}
-                _settings_cache_mtime = None
-        else:
-            # File doesn't exist - use empty cache
-            _settings_cache = {}
-            _settings_cache_mtime = None
-        
-        # Return value from newly loaded cache
-        if key in _settings_cache:
-            return _settings_cache[key]
-        return DEFAULT_SETTINGS.get(key, None)
-        
     except Exception:
-        # On error, fall back to defaults
-        return DEFAULT_SETTINGS.get(key, None)
+        # Lock error or unparseable file - do not read without lock, retry on the next call
+        _settings_cache = None
+    return _settings_cache
+
+def get_setting(key):
+    """
+    Load a single setting from the settings.json file in ../streamerData.
+    Uses centralized defaults if the key is not found.
+    Caches settings in memory and only re-reads file when modified.
+    """
+    settings = _refresh_settings_cache()
+    if settings is not None and key in settings:
+        return settings[key]
+    # On error or missing key, fall back to defaults
+    return DEFAULT_SETTINGS.get(key, None)
+
+def get_settings(*keys):
+    """
+    Load several settings at once with a single cache check.
+    Returns a dict of key -> value, using centralized defaults for missing keys.
+    """
+    settings = ChainMap(_refresh_settings_cache() or {}, DEFAULT_SETTINGS)
+    return {key: settings.get(key) for key in keys}
+
+def _read_small_file(path, size=1024):
+    """Read up to size bytes of a tiny procfs/sysfs/pid file with a single raw read (no buffered file object)"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
 
 def is_pid_running(pid):
     """
-    Check if a process with the given PID is actually running using psutil.
+    Check if a process with the given PID is actually running.
+    Reads the state field of /proc/<pid>/stat directly on Linux, falling back to psutil elsewhere.
     Returns False for non-existent, zombie, or dead processes.
     """
+    if pid is None or pid <= 0:
+        return False
+    try:
+        data = _read_small_file(f'/proc/{pid}/stat')
+        # The command name is in parentheses and may contain spaces, so split after the last ')'
+        state = data.rsplit(b')', 1)[1].split()[0]
+        return state not in (b'Z', b'X')
+    except FileNotFoundError:
+        if os.path.isdir('/proc/self'):
+            return False
+    except (OSError, IndexError):
+        pass
+    
+    # No procfs (non-Linux) or unparseable stat - ask psutil
     try:
         process = psutil.Process(pid)
         # Check if process is running (not zombie/dead)
@@ -345,8 +665,7 @@ def is_streaming():
     # Check if streaming is active (relay-ffmpeg.py)
     if os.path.exists(STREAM_PIDFILE):
         try:
-            with open(STREAM_PIDFILE) as f:
-                pid = int(f.read().strip())
+            pid = int(_read_small_file(STREAM_PIDFILE))
             # Check if the process is still running
             if is_pid_running(pid):
                 return True
@@ -377,15 +696,14 @@ def get_gps_tracking_status():
     
     if os.path.exists(GPS_PIDFILE):
         try:
-            with open(GPS_PIDFILE, 'r') as f:
-                line = f.read().strip()
-                if line:
-                    parts = line.split(':', 3)
-                    if len(parts) >= 4:
-                        pid_str, username, domain, track_id = parts
-                        pid = int(pid_str)
-                        if not is_pid_running(pid):
-                            pid, username, domain, track_id = None, None, None, None
+            line = _read_small_file(GPS_PIDFILE).decode().strip()
+            if line:
+                parts = line.split(':', 3)
+                if len(parts) >= 4:
+                    pid_str, username, domain, track_id = parts
+                    pid = int(pid_str)
+                    if not is_pid_running(pid):
+                        pid, username, domain, track_id = None, None, None, None
         except Exception:
             pass
     
@@ -404,8 +722,8 @@ def get_gps_tracking_status():
     # Try to read detailed status from status file - this might have more recent info than PID file
     if os.path.exists(GPS_STATUS_FILE):
         try:
-            with open(GPS_STATUS_FILE, 'r') as f:
-                detailed_status = json.load(f)
+            with open(GPS_STATUS_FILE, 'rb') as f:
+                detailed_status = _jload(f)
                 # Update the default status with detailed info
                 tracking_status.update(detailed_status)
                 # If we have status file info but no running process, keep process info as False
@@ -438,14 +756,14 @@ def load_settings():
     Returns a dictionary with all settings, using defaults for any missing keys.
     Uses file locking to prevent conflicts between processes.
     """
-    settings = DEFAULT_SETTINGS.copy()
+    user_settings = {}
     if os.path.exists(SETTINGS_FILE):
         try:
-            with open(SETTINGS_FILE, 'r') as f:
+            with open(SETTINGS_FILE, 'rb') as f:
                 # Acquire shared lock for reading
                 fcntl.flock(f.fileno(), fcntl.LOCK_SH)
                 try:
-                    settings.update(json.load(f))
+                    user_settings = _jload(f)
                 finally:
                     # Release lock
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -455,163 +773,326 @@ def load_settings():
         except (OSError, IOError) as e:
             print(f"Warning: Could not lock settings.json for reading: {e}")
             # Do not attempt to read without lock - keep default settings on lock error
-    return settings
+    # Callers modify and save the result, so hand back a plain dict built in a single pass
+    return dict(ChainMap(user_settings, DEFAULT_SETTINGS))
 
 def save_settings(settings):
     """
     Save settings to the settings.json file.
-    Uses file locking to prevent conflicts between processes.
+    Writes to a temporary file and atomically renames it over settings.json, so readers
+    never see a partially written file. Skips the write if the content is unchanged.
     """
     # Ensure the directory exists
-    os.makedirs(os.path.dirname(SETTINGS_FILE), exist_ok=True)
+    settings_dir = os.path.dirname(SETTINGS_FILE)
+    os.makedirs(settings_dir, exist_ok=True)
     
+    data = _jdumps(settings)
+    
+    # Nothing to do if the file already holds exactly this content (saves SD card writes)
     try:
-        with open(SETTINGS_FILE, 'w') as f:
-            # Acquire exclusive lock for writing
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            try:
-                json.dump(settings, f, indent=2)
-            finally:
-                # Release lock
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                
+        with open(SETTINGS_FILE, 'rb') as f:
+            if f.read() == data:
+                return
+    except (OSError, IOError):
+        pass
+    
+    tmp_path = None
+    try:
+        # Unique temp file per writer so concurrent saves cannot interleave
+        fd, tmp_path = tempfile.mkstemp(dir=settings_dir, prefix='.settings.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            os.fchmod(f.fileno(), 0o644)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, SETTINGS_FILE)
     except (OSError, IOError) as e:
-        print(f"Warning: Could not lock settings file for writing: {e}")
-        # Try to write without lock as fallback
-        try:
-            with open(SETTINGS_FILE, 'w') as f:
-                json.dump(settings, f, indent=2)
-        except Exception as e:
-            print(f"Error: Could not save settings: {e}")
-            raise
+        print(f"Error: Could not save settings: {e}")
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        raise
 
 # =============================================================================
 # USB Storage Functions
 # ==============================================================================
 
+# Timestamped stdout logger behind log_message; records are written immediately so they stay
+# in order with print() output and are not lost if the process is killed
+_message_logger = logging.getLogger('rpi_streamer.utils')
+_message_logger.setLevel(logging.INFO)
+_message_logger.propagate = False
+_message_stream_handler = logging.StreamHandler(sys.stdout)
+_message_stream_handler.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', '%Y-%m-%d %H:%M:%S'))
+_message_logger.addHandler(_message_stream_handler)
+
 def log_message(message):
     """
-    Print a message with timestamp for better debugging.
+    Log a message with timestamp for better debugging.
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[{timestamp}] {message}")
+    _message_logger.info(message)
 
-def detect_usb_devices():
+def _read_sysfs_flag(path):
+    """Return True if a sysfs attribute file contains '1'"""
+    try:
+        return _read_small_file(path, 16).strip() == b'1'
+    except OSError:
+        return False
+
+# Live set of USB partitions maintained from udev events (insertion-ordered dict used as a set)
+_usb_udev_monitor = None  # None = not set up yet, False = pyudev unavailable
+_usb_udev_partitions = {}
+
+def _get_usb_partitions_udev():
     """
-    Detect USB storage devices that are plugged in but not necessarily mounted.
-    Returns a list of device paths (e.g., ['/dev/sda1', '/dev/sdb1']).
-    Uses multiple detection methods for better compatibility.
+    Return the USB storage partitions currently known to udev, or None if pyudev is unavailable.
+    The set is seeded with one enumeration and afterwards only updated from queued
+    add/remove events, so each call costs a non-blocking read of the netlink socket.
     """
-    usb_devices = []
+    global _usb_udev_monitor
     
-    # Method 1: Use lsblk to find removable storage devices
-    try:
-        log_message("Detecting USB devices using lsblk...")
-        result = subprocess.run(['lsblk', '-n', '-o', 'NAME,TYPE,MOUNTPOINT,HOTPLUG,RM'], 
-                               capture_output=True, text=True, timeout=10)
-        
-        if result.returncode == 0:
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        name_raw, device_type = parts[0], parts[1]
-                        hotplug = parts[3] if len(parts) > 3 else '0'
-                        removable = parts[4] if len(parts) > 4 else '0'
-                        
-                        # Clean up the device name - remove tree drawing characters
-                        name = name_raw
-                        for char in ['└─', '├─', '│ ', '├ ', '└ ']:
-                            name = name.replace(char, '')
-                        name = name.strip()
-                        
-                        # Look for partitions on removable/hotplug devices
-                        if (device_type == 'part' and 
-                            (hotplug == '1' or removable == '1') and
-                            not name.startswith('mmcblk')):  # Exclude SD card
-                            
-                            device_path = f'/dev/{name}'
-                            if device_path not in usb_devices:
-                                usb_devices.append(device_path)
-                                log_message(f"Found USB device via lsblk: {device_path}")
-    except Exception as e:
-        log_message(f"lsblk detection failed: {e}")
+    if _usb_udev_monitor is None:
+        _usb_udev_monitor = False
+        # Without a running udevd the enumeration has no ID_BUS properties, so fall back to sysfs
+        if pyudev is not None and os.path.exists('/run/udev/control'):
+            try:
+                context = pyudev.Context()
+                monitor = pyudev.Monitor.from_netlink(context)
+                monitor.filter_by('block', 'partition')
+                # Start listening before enumerating so no event in between is lost
+                monitor.start()
+                _usb_udev_partitions.clear()
+                for device in context.list_devices(subsystem='block', DEVTYPE='partition', ID_BUS='usb'):
+                    if device.device_node:
+                        _usb_udev_partitions[device.device_node] = None
+                _usb_udev_monitor = monitor
+            except Exception as e:
+                log_message(f"udev monitoring unavailable: {e}")
+    
+    if not _usb_udev_monitor:
+        return None
     
-    # Method 2: Check /dev for sd* devices (fallback method)
     try:
-        log_message("Detecting USB devices using /dev scan...")
-        for device_file in os.listdir('/dev'):
-            # Look for USB storage devices (sd* pattern, excluding sda which is usually the SD card)
-            if (device_file.startswith('sd') and 
-                len(device_file) == 4 and 
-                device_file[-1].isdigit() and
-                device_file not in ['sda1', 'sda2']):  # Exclude main SD card partitions
-                
-                device_path = f'/dev/{device_file}'
-                
-                # Verify it's a block device and not already found
-                if device_path not in usb_devices:
-                    try:
-                        result = subprocess.run(['lsblk', '-n', '-o', 'TYPE', device_path], 
-                                              capture_output=True, text=True, timeout=5)
-                        if result.returncode == 0 and 'part' in result.stdout:
-                            usb_devices.append(device_path)
-                            log_message(f"Found USB device via /dev scan: {device_path}")
-                    except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
-                        continue
-                        
+        while True:
+            device = _usb_udev_monitor.poll(timeout=0)
+            if device is None:
+                break
+            if device.action == 'remove':
+                _usb_udev_partitions.pop(device.device_node, None)
+                _fstype_cache.pop(device.device_node, None)
+            elif device.get('ID_BUS') == 'usb' and device.device_node:
+                _usb_udev_partitions[device.device_node] = None
     except Exception as e:
-        log_message(f"Error in /dev scan: {e}")
+        # Netlink buffer overflow or similar - re-seed from a fresh enumeration on the next call
+        log_message(f"udev event read failed, rescanning: {e}")
+        _usb_udev_monitor = None
+        return _get_usb_partitions_udev()
+    return list(_usb_udev_partitions)
+
+def detect_usb_devices(fast_mode=False):
+    """
+    Detect USB storage devices that are plugged in but not necessarily mounted.
+    Returns a list of device paths (e.g., ['/dev/sda1', '/dev/sdb1']).
+    Uses the udev-maintained device set when pyudev is available; otherwise uses multiple
+    detection methods that read sysfs/devfs directly so no external commands are spawned.
+    With fast_mode=True the /dev/disk/by-id fallback is skipped once the sysfs walk found a device.
+    """
+    udev_devices = _get_usb_partitions_udev()
+    if udev_devices is not None:
+        log_message(f"Total USB devices detected (udev): {len(udev_devices)}")
+        return udev_devices
+    
+    usb_devices = {}  # insertion-ordered set
     
-    # Method 3: Check for USB devices using udevadm (most reliable)
+    # Method 1: Walk /sys/block for partitions on removable/hotplug disks (same data lsblk reports)
+    # Method 2: sd* partitions (fallback, excluding sda1/sda2 which are usually the main SD card)
     try:
-        log_message("Detecting USB devices using udevadm...")
-        result = subprocess.run(['find', '/dev/disk/by-id/', '-name', '*usb*', '-type', 'l'], 
-                               capture_output=True, text=True, timeout=10)
-        
-        if result.returncode == 0:
-            for usb_link in result.stdout.strip().split('\n'):
-                if usb_link.strip():
-                    try:
-                        # Resolve the symbolic link to get the actual device path
-                        real_device = os.path.realpath(usb_link)
-                        
-                        # Only include partitions, not whole disks
-                        if real_device and real_device[-1].isdigit():
-                            if real_device not in usb_devices:
-                                usb_devices.append(real_device)
-                                log_message(f"Found USB device via udevadm: {real_device} (from {usb_link})")
-                    except Exception as e:
-                        log_message(f"Error resolving USB link {usb_link}: {e}")
-                        
+        log_message("Detecting USB devices using sysfs...")
+        with os.scandir('/sys/block') as disks:
+            for disk in sorted(disks, key=lambda e: e.name):
+                if disk.name.startswith(('loop', 'ram', 'zram', 'mmcblk')):  # Exclude SD card and virtual disks
+                    continue
+                # RM flag, or HOTPLUG: the disk hangs off a USB bus
+                removable = (_read_sysfs_flag(f'{disk.path}/removable') or
+                             '/usb' in os.path.realpath(disk.path))
+                try:
+                    with os.scandir(disk.path) as it:
+                        partitions = sorted(entry.name for entry in it
+                                            if entry.name.startswith(disk.name) and
+                                            os.path.exists(f'{entry.path}/partition'))
+                except OSError:
+                    continue
+                for name in partitions:
+                    device_path = f'/dev/{name}'
+                    if removable:
+                        usb_devices.setdefault(device_path, None)
+                        log_message(f"Found USB device via sysfs: {device_path}")
+                    elif (name.startswith('sd') and len(name) == 4 and name[-1].isdigit() and
+                          name not in ['sda1', 'sda2'] and os.path.exists(device_path)):
+                        usb_devices.setdefault(device_path, None)
+                        log_message(f"Found USB device via /dev scan: {device_path}")
     except Exception as e:
-        log_message(f"udevadm detection failed: {e}")
+        log_message(f"sysfs detection failed: {e}")
     
-    # Remove duplicates while preserving order
-    unique_devices = []
-    for device in usb_devices:
-        if device not in unique_devices:
-            unique_devices.append(device)
+    # Method 3: Resolve the usb-* links udev creates under /dev/disk/by-id (most reliable;
+    # in fast mode only used when the sysfs walk found nothing)
+    if not (fast_mode and usb_devices):
+        try:
+            log_message("Detecting USB devices using /dev/disk/by-id...")
+            with os.scandir('/dev/disk/by-id') as it:
+                usb_links = sorted(entry.path for entry in it
+                                   if 'usb' in entry.name and entry.is_symlink())
+            for usb_link in usb_links:
+                try:
+                    # Resolve the symbolic link to get the actual device path; udev's by-id links
+                    # point straight at the node (../../sdb1), so one readlink is enough
+                    real_device = os.path.normpath(os.path.join('/dev/disk/by-id', os.readlink(usb_link)))
+                    
+                    # Only include partitions, not whole disks
+                    if real_device and real_device[-1].isdigit() and real_device not in usb_devices:
+                        usb_devices[real_device] = None
+                        log_message(f"Found USB device via udev: {real_device} (from {usb_link})")
+                except Exception as e:
+                    log_message(f"Error resolving USB link {usb_link}: {e}")
+        except FileNotFoundError:
+            pass  # No by-id links (no udev, or no disks with IDs)
+        except Exception as e:
+            log_message(f"udev link detection failed: {e}")
     
-    log_message(f"Total USB devices detected: {len(unique_devices)}")
-    return unique_devices
+    log_message(f"Total USB devices detected: {len(usb_devices)}")
+    return list(usb_devices)
 
 def get_filesystem_type(device_path):
     """
     Get the filesystem type of a device.
     Returns the filesystem type string or None if detection fails.
     """
+    return get_filesystem_types([device_path])[device_path]
+
+def _probe_filesystem_type(device_path):
+    """
+    Identify the filesystem on a block device from its superblock magic bytes.
+    Recognizes ext2/3/4, FAT, exFAT and NTFS (blkid naming); returns None for anything else.
+    """
+    # Everything checked lives in the first 2 KiB: one pread, no buffered file object
+    fd = os.open(device_path, os.O_RDONLY | os.O_CLOEXEC)
     try:
-        result = subprocess.run(['blkid', '-o', 'value', '-s', 'TYPE', device_path], 
-                               capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            fstype = result.stdout.strip()
-            log_message(f"Device {device_path} has filesystem: {fstype}")
-            return fstype
-    except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
-        log_message(f"Failed to detect filesystem for {device_path}: {e}")
+        boot = os.pread(fd, 2048, 0)
+    finally:
+        os.close(fd)
+    if len(boot) < 2048:
+        return None
+    if boot[3:11] == b'NTFS    ':
+        return 'ntfs'
+    if boot[3:11] == b'EXFAT   ':
+        return 'exfat'
+    if boot[510:512] == b'\x55\xaa' and (boot[82:87] == b'FAT32' or boot[54:59] in (b'FAT12', b'FAT16')):
+        return 'vfat'
+    # ext superblock starts at byte 1024; s_magic is at offset 0x38
+    if boot[1080:1082] == b'\x53\xef':
+        compat, incompat = struct.unpack_from('<II', boot, 1024 + 0x5C)
+        if incompat & 0x2C0:  # extents, 64bit or flex_bg
+            return 'ext4'
+        return 'ext3' if compat & 0x4 else 'ext2'  # has_journal
     return None
 
+# Filesystem type per device, keyed on the device node's (st_rdev, st_mtime_ns) so a
+# replugged or reformatted device is probed again
+_fstype_cache = {}
+
+def get_filesystem_types(device_paths: list[str]) -> dict[str, Optional[str]]:
+    """
+    Get the filesystem types of several devices.
+    Reads superblocks directly (cached per device); anything unrecognized is resolved with a single blkid call.
+    Returns a dict mapping each device path to its filesystem type (or None).
+    """
+    fstypes = {device_path: None for device_path in device_paths}
+    unresolved = []
+    for device_path in device_paths:
+        try:
+            st = os.stat(device_path)
+            key = (st.st_rdev, st.st_mtime_ns)
+            cached = _fstype_cache.get(device_path)
+            if cached is not None and cached[0] == key:
+                fstypes[device_path] = cached[1]
+                continue
+            fstype = _probe_filesystem_type(device_path)
+        except OSError:
+            fstype = None
+        if fstype:
+            _fstype_cache[device_path] = (key, fstype)
+            fstypes[device_path] = fstype
+            log_message(f"Device {device_path} has filesystem: {fstype}")
+        else:
+            unresolved.append(device_path)
+    if not unresolved:
+        return fstypes
+    try:
+        # -c /dev/null bypasses libblkid's cache so stale entries are never returned
+        result = subprocess.run(['blkid', '-c', '/dev/null', '-o', 'export'] + unresolved,
+                               capture_output=True, text=True, timeout=5)
+        # blkid exits non-zero if any device could not be probed, but still
+        # prints the blocks for the ones it could, so parse stdout regardless
+        for block in result.stdout.strip().split('\n\n'):
+            values = dict(line.split('=', 1) for line in block.splitlines() if '=' in line)
+            devname = values.get('DEVNAME')
+            if devname:
+                fstypes[devname] = values.get('TYPE')
+                log_message(f"Device {devname} has filesystem: {values.get('TYPE')}")
+    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, OSError) as e:
+        log_message(f"Failed to detect filesystems for {unresolved}: {e}")
+    return fstypes
+
+# Mount options per filesystem type; anything not listed mounts with 'defaults'
+_FS_MOUNT_OPTS = {
+    # FAT/NTFS filesystems support uid/gid/umask options
+    'vfat': 'uid=1000,gid=1000,umask=022',
+    'fat32': 'uid=1000,gid=1000,umask=022',
+    'fat16': 'uid=1000,gid=1000,umask=022',
+    'msdos': 'uid=1000,gid=1000,umask=022',
+    'ntfs': 'uid=1000,gid=1000,umask=022',
+    'exfat': 'uid=1000,gid=1000,umask=022',
+    # Linux native filesystems use different ownership approach
+    'ext4': 'defaults',
+    'ext3': 'defaults',
+    'ext2': 'defaults',
+    'ext': 'defaults',
+}
+
+# Filesystems the kernel can mount itself, i.e. without a userspace mount helper such as ntfs-3g
+_DIRECT_MOUNT_FSTYPES = ('vfat', 'exfat', 'ext4', 'ext3', 'ext2')
+
+_libc = None  # None = not loaded yet, False = libc could not be loaded
+
+def _get_libc():
+    """Load the C library once for direct syscalls (mount, umount, syncfs); returns None if unavailable"""
+    global _libc
+    if _libc is None:
+        try:
+            _libc = ctypes.CDLL(None, use_errno=True)
+        except OSError:
+            _libc = False
+    return _libc or None
+
+def _mount_direct(device_path, mount_point, fstype, options):
+    """
+    Mount with a single mount(2) call instead of forking 'sudo mount'.
+    Only possible when running as root; returns True if the filesystem was mounted.
+    """
+    if os.geteuid() != 0 or fstype not in _DIRECT_MOUNT_FSTYPES:
+        return False
+    libc = _get_libc()
+    if libc is None:
+        return False
+    data = None if options == 'defaults' else options.encode()
+    if libc.mount(device_path.encode(), mount_point.encode(), fstype.encode(), 0, data) != 0:
+        err = ctypes.get_errno()
+        log_message(f"Direct mount of {device_path} as {fstype} failed: {os.strerror(err)}")
+        return False
+    return True
+
 def mount_usb_device(device_path, fstype):
     """
     Mount a USB device with auto-detection and fallback options.
@@ -625,21 +1106,26 @@ def mount_usb_device(device_path, fstype):
         # Create mount point directory
         os.makedirs(mount_point, exist_ok=True)
         
-        # Determine mount options based on filesystem type
-        def get_mount_options(fs_type):
-            """Get appropriate mount options for the filesystem type"""
-            if fs_type in ['vfat', 'fat32', 'fat16', 'msdos', 'ntfs', 'exfat']:
-                # FAT/NTFS filesystems support uid/gid/umask options
-                return 'uid=1000,gid=1000,umask=022'
-            elif fs_type in ['ext4', 'ext3', 'ext2', 'ext']:
-                # Linux native filesystems use different ownership approach
-                return 'defaults'
-            else:
-                # Unknown filesystem - use minimal options
-                return 'defaults'
+        mount_options = _FS_MOUNT_OPTS.get(fstype or '', 'defaults')
+        
+        # Fast path: mount(2) directly when running as root with a kernel-supported filesystem
+        if _mount_direct(device_path, mount_point, fstype, mount_options):
+            # For ext filesystems, fix ownership after mounting
+            if fstype.startswith('ext'):
+                try:
+                    subprocess.run(['sudo', 'chown', '-R', '1000:1000', mount_point], 
+                                 capture_output=True, timeout=5)
+                    subprocess.run(['sudo', 'chmod', '-R', '755', mount_point], 
+                                 capture_output=True, timeout=5)
+                except Exception as e:
+                    log_message(f"Warning: Could not fix ownership for {mount_point}: {e}")
+            if os.access(mount_point, os.W_OK):
+                log_message(f"Successfully mounted {device_path} at {mount_point} using {fstype}")
+                return mount_point
+            log_message(f"Mount succeeded but directory not writable: {mount_point}")
+            _get_libc().umount(mount_point.encode())
         
         # First try: Use auto-detection with appropriate options
-        mount_options = get_mount_options(fstype or 'auto')
         mount_cmd = [
             'sudo', 'mount', 
             '-t', 'auto',
@@ -679,7 +1165,7 @@ def mount_usb_device(device_path, fstype):
             # Fallback: Try with detected filesystem type if available
             if fstype:
                 log_message(f"Trying fallback mount with detected filesystem type: {fstype}")
-                fs_mount_options = get_mount_options(fstype)
+                fs_mount_options = _FS_MOUNT_OPTS.get(fstype or '', 'defaults')
                 mount_cmd_fs = [
                     'sudo', 'mount', 
                     '-t', fstype,
@@ -717,7 +1203,7 @@ def mount_usb_device(device_path, fstype):
                     continue
                     
                 log_message(f"Trying fallback mount with filesystem type: {fs_type}")
-                fs_mount_options = get_mount_options(fs_type)
+                fs_mount_options = _FS_MOUNT_OPTS.get(fs_type, 'defaults')
                 mount_cmd_fallback = [
                     'sudo', 'mount', 
                     '-t', fs_type,
@@ -758,7 +1244,40 @@ def mount_usb_device(device_path, fstype):
     return None
 
 
-def cleanup_pidfile(pidfile_path: str, cleanup_callback=None, sync_usb: bool = True, logger=None):
+def _syncfs(path):
+    """
+    Flush only the filesystem containing path with syncfs(2).
+    Returns False if syncfs is unavailable, so the caller can fall back to a full sync.
+    """
+    syncfs = getattr(_get_libc(), 'syncfs', None)  # glibc >= 2.14
+    if syncfs is None:
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if syncfs(fd) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+    finally:
+        os.close(fd)
+    return True
+
+def _wait_for_writeback(timeout=2.0, threshold_kb=1024):
+    """Poll /proc/meminfo until Dirty + Writeback pages drop below threshold_kb (at most timeout seconds)"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            pending_kb = 0
+            for line in _read_small_file('/proc/meminfo', 8192).splitlines():
+                if line.startswith((b'Dirty:', b'Writeback:')):
+                    pending_kb += int(line.split()[1])
+        except (OSError, ValueError, IndexError):
+            return
+        if pending_kb < threshold_kb or time.monotonic() >= deadline:
+            return
+        time.sleep(0.05)
+
+def cleanup_pidfile(pidfile_path: str, cleanup_callback=None, sync_usb: bool = True, logger=None,
+                    sync_path: Optional[str] = None):
     """
     Generic PID file cleanup function with optional USB sync and custom cleanup
     
@@ -767,6 +1286,7 @@ def cleanup_pidfile(pidfile_path: str, cleanup_callback=None, sync_usb: bool = T
         cleanup_callback: Optional function to call before removing PID file
         sync_usb: Whether to perform USB sync (default: True)
         logger: Optional logger for messages (uses print if None)
+        sync_path: Optional path on the USB drive; if given only that filesystem is synced
     """
     def log_message(msg: str, level: str = "info"):
         if logger:
@@ -781,11 +1301,14 @@ def cleanup_pidfile(pidfile_path: str, cleanup_callback=None, sync_usb: bool = T
     
     # Perform USB sync if requested
     if sync_usb:
-        log_message("Syncing all data to disk (including USB drives)...")
         try:
-            import subprocess
-            subprocess.run(['sync'], check=True)
-            time.sleep(2)  # Give extra time for exFAT/USB
+            if sync_path and _syncfs(sync_path):
+                log_message(f"Synced {sync_path} to disk")
+            else:
+                log_message("Syncing all data to disk (including USB drives)...")
+                os.sync()
+                # Give exFAT/USB time to finish writeback, but only as long as pages are still pending
+                _wait_for_writeback()
             log_message("Sync completed. It is now safe to remove the USB drive.")
         except Exception as e:
             log_message(f"Warning: Final sync failed: {e}", "warning")
@@ -806,6 +1329,51 @@ def cleanup_pidfile(pidfile_path: str, cleanup_callback=None, sync_usb: bool = T
         log_message(f"Warning: Could not remove PID file on exit: {e}", "warning")
 
 
+def _fast_mount_check(mount_point):
+    """
+    Check a mount point with a minimum of syscalls.
+    Returns None if it is missing or not readable/writable, otherwise whether it is an active mount.
+    """
+    try:
+        st = os.stat(mount_point)
+        parent_st = os.stat(os.path.join(mount_point, '..'))
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode) or not os.access(mount_point, os.R_OK | os.W_OK):
+        return None
+    # Same test os.path.ismount uses: a mount point lives on a different device than
+    # its parent, or is its own parent (filesystem root)
+    return st.st_dev != parent_st.st_dev or st.st_ino == parent_st.st_ino
+
+
+def _find_mounted_usb(mounts):
+    """
+    Return the mount point of the first already-mounted, accessible USB partition, or None.
+    mounts is a list of (device, mount_point, fstype) tuples parsed from /proc/mounts.
+    """
+    # Lazily filtered so the scan stops at the first usable mount
+    usb_mounts = ((device, mount_point, fstype) for device, mount_point, fstype in mounts
+                  if device.startswith('/dev/sd') and
+                  device != '/dev/sda' and  # Exclude main SD card (if it exists)
+                  not device.endswith('a') and  # Skip whole disks, only partitions
+                  fstype in ('vfat', 'exfat', 'ntfs', 'ext4', 'ext3', 'ext2') and
+                  mount_point != '/')  # Ignore root mount point
+    for device, mount_point, fstype in usb_mounts:
+        # Verify the device still exists and mount point is accessible
+        is_mount = _fast_mount_check(mount_point) if os.path.exists(device) else None
+        if is_mount is not None:
+            
+            # Double-check it's actually mounted (st_dev differs from parent)
+            if is_mount:
+                log_message(f"Found already mounted USB storage: {mount_point} (device: {device}, filesystem: {fstype})")
+                return mount_point
+            else:
+                log_message(f"Mount point {mount_point} appears in /proc/mounts but is not actually mounted")
+        else:
+            log_message(f"USB device {device} or mount point {mount_point} no longer accessible")
+    return None
+
+
 def find_usb_storage():
     """
     Find and mount the first available USB storage device on Raspberry Pi Lite.
@@ -813,44 +1381,32 @@ def find_usb_storage():
     """
     log_message("Detecting USB storage devices...")
     
-    # First check if any USB devices are already mounted
+    # Parse /proc/mounts once; the snapshot serves both the already-mounted scan and the per-device check
+    mounts = []
     try:
         with open('/proc/mounts', 'r') as f:
-            for line in f:
-                parts = line.split()
-                if len(parts) >= 3:
-                    device, mount_point, fstype = parts[0], parts[1], parts[2]
-                    # Look for already mounted USB devices
-                    if (device.startswith('/dev/sd') and 
-                        device != '/dev/sda' and  # Exclude main SD card (if it exists)
-                        not device.endswith('a') and  # Skip whole disks, only partitions
-                        fstype in ['vfat', 'exfat', 'ntfs', 'ext4', 'ext3', 'ext2'] and
-                        mount_point != '/'):  # Ignore root mount point
-                        
-                        # Verify the device still exists and mount point is accessible
-                        if (os.path.exists(device) and 
-                            os.path.exists(mount_point) and 
-                            os.access(mount_point, os.R_OK) and
-                            os.access(mount_point, os.W_OK)):
-                            
-                            # Double-check it's actually mounted using os.path.ismount
-                            if os.path.ismount(mount_point):
-                                log_message(f"Found already mounted USB storage: {mount_point} (device: {device}, filesystem: {fstype})")
-                                return mount_point
-                            else:
-                                log_message(f"Mount point {mount_point} appears in /proc/mounts but is not actually mounted")
-                        else:
-                            log_message(f"USB device {device} or mount point {mount_point} no longer accessible")
+            mounts = [tuple(parts[:3]) for parts in map(str.split, f) if len(parts) >= 3]
     except Exception as e:
         log_message(f"Error checking mounted devices: {e}")
+    mount_points = {}
+    for device, mount_point, _ in mounts:
+        mount_points.setdefault(device, mount_point)
+    
+    # First check if any USB devices are already mounted - the common case needs no device detection
+    mount_point = _find_mounted_usb(mounts)
+    if mount_point:
+        return mount_point
     
     # Detect unmounted USB devices
-    usb_devices = detect_usb_devices()
+    usb_devices = detect_usb_devices(fast_mode=True)
     
     if not usb_devices:
         log_message("No USB storage devices detected")
         return None
-    
+
+    # Probe all candidate filesystems in one blkid call
+    fstypes = get_filesystem_types(usb_devices)
+
     # Try to mount the first detected USB device
     for device_path in usb_devices:
         log_message(f"Attempting to mount USB device: {device_path}")
@@ -861,21 +1417,13 @@ def find_usb_storage():
             continue
         
         # Check if this device is already mounted
-        try:
-            with open('/proc/mounts', 'r') as f:
-                for line in f:
-                    parts = line.split()
-                    if len(parts) >= 2 and parts[0] == device_path:
-                        mount_point = parts[1]
-                        if os.path.exists(mount_point) and os.access(mount_point, os.W_OK):
-                            log_message(f"Device {device_path} is already mounted at {mount_point}")
-                            return mount_point
-                        break
-        except Exception as e:
-            log_message(f"Error checking if {device_path} is mounted: {e}")
+        mount_point = mount_points.get(device_path)
+        if mount_point and _fast_mount_check(mount_point):
+            log_message(f"Device {device_path} is already mounted at {mount_point}")
+            return mount_point
         
         # Get filesystem type
-        fstype = get_filesystem_type(device_path)
+        fstype = fstypes.get(device_path)
         if not fstype:
             log_message(f"Could not determine filesystem type for {device_path}, skipping")
             continue
@@ -926,6 +1474,117 @@ def get_video_duration_mediainfo(path):
     return None
 
 
+# Recording files are named <unix timestamp>.mp4
+_RECORDING_TIMESTAMP_RE = re.compile(r'^(\d+)\.mp4$')
+
+# Per-directory sidecar caching recording durations, keyed by filename
+DURATION_CACHE_FILE = '.durations.json'
+
+def _load_duration_cache(dir_path):
+    """Load the duration sidecar of a recordings directory (empty dict if missing or unreadable)"""
+    try:
+        with open(os.path.join(dir_path, DURATION_CACHE_FILE), 'rb') as f:
+            cache = _jload(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_duration_cache(dir_path, cache):
+    """Atomically write the duration sidecar of a recordings directory (best effort)"""
+    cache_path = os.path.join(dir_path, DURATION_CACHE_FILE)
+    tmp_path = None
+    try:
+        # Unique temp file per writer so concurrent listings cannot clobber each other's write
+        fd, tmp_path = tempfile.mkstemp(dir=dir_path, prefix='.durations.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            # mkstemp creates the file 0600; match the recordings' permissions as save_settings does
+            try:
+                os.fchmod(f.fileno(), 0o644)
+            except OSError:
+                pass  # FAT/exFAT USB drives mounted with fixed permissions reject chmod
+            f.write(_jdumps(cache))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Read-only or full storage - the durations are simply recomputed next time
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+def _scan_recordings_dir(domain, rtmpkey, rtmpkey_path, source_label, location, active_only, active_file_abs):
+    """Build the recording entries for one <domain>/<rtmpkey> directory, newest first"""
+    recording_files = []
+    
+    # Get all mp4 files in this rtmpkey directory (one stat each, reused below)
+    with os.scandir(rtmpkey_path) as it:
+        entries = [(entry, entry.stat()) for entry in it
+                   if entry.name.endswith('.mp4') and entry.is_file()]
+    entries.sort(key=lambda item: item[1].st_mtime, reverse=True)
+    files = [entry.name for entry, _ in entries]
+    
+    # Durations cached from earlier listings, loaded on first use
+    duration_cache = None
+    cache_dirty = False
+    
+    for entry, st in entries:
+        f = entry.name
+        file_path = entry.path
+        file_size = st.st_size
+        
+        # Create a more descriptive display name with domain and rtmpkey
+        display_name = f"{source_label}{domain}/{rtmpkey}/{f}" if source_label else f"{domain}/{rtmpkey}/{f}"
+        
+        is_active = active_file_abs is not None and os.path.abspath(file_path) == active_file_abs
+        
+        # Skip non-active files if active_only is True
+        if active_only and not is_active:
+            continue
+            
+        # Add duration if file is not active, reusing the cached value while size and mtime match
+        if is_active:
+            duration = None
+        else:
+            if duration_cache is None:
+                duration_cache = _load_duration_cache(rtmpkey_path)
+            file_mtime = st.st_mtime
+            cached = duration_cache.get(f)
+            if (isinstance(cached, dict) and cached.get('size') == file_size and
+                    cached.get('mtime') == file_mtime):
+                duration = cached.get('duration')
+            else:
+                duration = get_video_duration_mediainfo(file_path)
+                if duration is not None:
+                    duration_cache[f] = {'size': file_size, 'mtime': file_mtime, 'duration': duration}
+                    cache_dirty = True
+            
+        # Extract timestamp from filename if possible
+        m = _RECORDING_TIMESTAMP_RE.match(f)
+        timestamp = int(m.group(1)) if m else None
+        
+        recording_files.append({
+            'path': file_path,
+            'size': file_size,
+            'active': is_active,
+            'name': display_name,
+            'location': location,
+            'duration': duration,
+            'timestamp': timestamp,
+            'domain': domain,
+            'rtmpkey': rtmpkey
+        })
+    
+    if duration_cache is not None:
+        # Forget recordings that were deleted or moved away
+        present = set(files)
+        stale = [name for name in duration_cache if name not in present]
+        for name in stale:
+            del duration_cache[name]
+        if cache_dirty or stale:
+            _save_duration_cache(rtmpkey_path, duration_cache)
+    
+    return recording_files
+
 def add_files_from_path(recording_files, path, source_label="", location="Local", active_only=False):
     """
     Helper function to add files from a given path. Appends to the passed-in recording_files list.
@@ -938,62 +1597,68 @@ def add_files_from_path(recording_files, path, source_label="", location="Local"
         location: Location identifier (e.g., "Local", "USB")
         active_only: If True, only include files that are currently being recorded
     """
-    active_pid, active_file = get_active_recording_info()
-    
     if not os.path.isdir(path):
         return
     
+    # Resolve the active recording once per call instead of per file
+    # (get_active_recording_info only returns a file whose recorder process is running)
+    active_pid, active_file = get_active_recording_info()
+    active_file_abs = os.path.abspath(active_file) if active_file and is_pid_running(active_pid) else None
+    
     # Walk through the hierarchical structure: domain/rtmpkey/files
-    for domain in os.listdir(path):
-        domain_path = os.path.join(path, domain)
-        if not os.path.isdir(domain_path):
-            continue
-            
-        for rtmpkey in os.listdir(domain_path):
-            rtmpkey_path = os.path.join(domain_path, rtmpkey)
-            if not os.path.isdir(rtmpkey_path):
-                continue
-                
-            # Get all mp4 files in this rtmpkey directory
-            files = [f for f in os.listdir(rtmpkey_path) 
-                    if os.path.isfile(os.path.join(rtmpkey_path, f)) and f.endswith('.mp4')]
-            files.sort(key=lambda f: os.path.getmtime(os.path.join(rtmpkey_path, f)), reverse=True)
-            
-            for f in files:
-                file_path = os.path.join(rtmpkey_path, f)
-                file_size = os.path.getsize(file_path)
-                
-                # Create a more descriptive display name with domain and rtmpkey
-                display_name = f"{source_label}{domain}/{rtmpkey}/{f}" if source_label else f"{domain}/{rtmpkey}/{f}"
-                
-                is_active = (active_file is not None and os.path.abspath(file_path) == os.path.abspath(active_file) and is_pid_running(active_pid))
-                
-                # Skip non-active files if active_only is True
-                if active_only and not is_active:
+    # scandir's DirEntry objects carry the file type (and cache stat), avoiding a stat per check
+    scan_args = []
+    with os.scandir(path) as domains:
+        domain_entries = [entry for entry in domains if entry.is_dir()]
+    for domain_entry in domain_entries:
+        with os.scandir(domain_entry.path) as rtmpkeys:
+            for rtmpkey_entry in rtmpkeys:
+                if rtmpkey_entry.is_dir():
+                    scan_args.append((domain_entry.name, rtmpkey_entry.name, rtmpkey_entry.path,
+                                      source_label, location, active_only, active_file_abs))
+    
+    if len(scan_args) > 1 and not active_only:
+        # rtmpkey directories are independent: overlap their stats and MediaInfo parses
+        # (results keep the directory order)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda args: _scan_recordings_dir(*args), scan_args))
+    else:
+        results = [_scan_recordings_dir(*args) for args in scan_args]
+    for files in results:
+        recording_files.extend(files)
+
+
+def _copy_file_kernel(src, dst):
+    """
+    Copy src to dst without bouncing the data through Python, then copy its mode and
+    timestamps like shutil.copy2. Uses sendfile between filesystems (e.g. SD card -> USB) and
+    copy_file_range within one, falling back to sendfile if the kernel refuses the range copy.
+    """
+    blocksize = 8 * 1024 * 1024
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        try:
+            os.posix_fadvise(infd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except (AttributeError, OSError):
+            pass
+        # Local filesystems reject cross-device copy_file_range (EXDEV), so don't even try
+        use_range = (hasattr(os, 'copy_file_range') and
+                     os.fstat(infd).st_dev == os.fstat(outfd).st_dev)
+        while True:
+            if use_range:
+                try:
+                    copied = os.copy_file_range(infd, outfd, blocksize)
+                except OSError as e:
+                    if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                        raise
+                    # Both calls continue from the current file offsets, so switching is safe mid-copy
+                    use_range = False
                     continue
-                    
-                # Add duration if file is not active
-                if is_active:
-                    duration = None
-                else:
-                    duration = get_video_duration_mediainfo(file_path)
-                    
-                # Extract timestamp from filename if possible
-                m = re.match(r'^(\d+)\.mp4$', f)
-                timestamp = int(m.group(1)) if m else None
-                
-                recording_files.append({
-                    'path': file_path,
-                    'size': file_size,
-                    'active': is_active,
-                    'name': display_name,
-                    'location': location,
-                    'duration': duration,
-                    'timestamp': timestamp,
-                    'domain': domain,
-                    'rtmpkey': rtmpkey
-                })
-
+            else:
+                copied = os.sendfile(outfd, infd, None, blocksize)
+            if copied == 0:
+                break
+    shutil.copystat(src, dst)
 
 def move_file_to_usb(file_path, usb_path):
     """
@@ -1044,9 +1709,23 @@ def move_file_to_usb(file_path, usb_path):
                 destination = os.path.join(destination_dir, new_filename)
                 counter += 1
         
-        # Move the file
-        import shutil
-        shutil.move(file_path, destination)
+        # Move the file: a plain rename when source and USB share a filesystem, otherwise an
+        # in-kernel copy to a temporary name (so listings never show a partial recording)
+        # followed by removing the source
+        if os.stat(file_path).st_dev == os.stat(destination_dir).st_dev:
+            os.rename(file_path, destination)
+        else:
+            partial = f"{destination}.part"
+            try:
+                _copy_file_kernel(file_path, partial)
+                os.replace(partial, destination)
+            except BaseException:
+                try:
+                    os.remove(partial)
+                except OSError:
+                    pass
+                raise
+            os.unlink(file_path)
         
         return {'success': True, 'destination': destination}
         
@@ -1054,6 +1733,41 @@ def move_file_to_usb(file_path, usb_path):
         return {'success': False, 'error': str(e)}
 
 
+# Checksum manifest kept next to the executables (locally and on the USB drive)
+EXEC_MANIFEST_FILE = '.manifest.json'
+
+def _load_exec_manifest(dir_path):
+    """Load an executables checksum manifest (empty dict if missing or unreadable)"""
+    try:
+        with open(os.path.join(dir_path, EXEC_MANIFEST_FILE), 'rb') as f:
+            manifest = _jload(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_exec_manifest(dir_path, manifest):
+    """Atomically write an executables checksum manifest (best effort)"""
+    manifest_path = os.path.join(dir_path, EXEC_MANIFEST_FILE)
+    tmp_path = None
+    try:
+        # Unique temp file per writer so concurrent copies cannot clobber each other's write
+        fd, tmp_path = tempfile.mkstemp(dir=dir_path, prefix='.manifest.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            # mkstemp creates the file 0600; match the executables' permissions as save_settings does
+            try:
+                os.fchmod(f.fileno(), 0o644)
+            except OSError:
+                pass  # FAT/exFAT USB drives mounted with fixed permissions reject chmod
+            f.write(_jdumps(manifest))
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        print(f"  Warning: Could not save checksum manifest in {dir_path}: {e}")
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
 def copy_executables_to_usb(usb_path):
     """
     Copy executables to USB drive if they don't exist or are outdated.
@@ -1067,8 +1781,6 @@ def copy_executables_to_usb(usb_path):
             'errors': list
         }
     """
-    import shutil
-    
     # Determine the parent directory containing executables
     script_dir = os.path.dirname(os.path.abspath(__file__))
     parent_dir = os.path.dirname(script_dir)
@@ -1077,30 +1789,45 @@ def copy_executables_to_usb(usb_path):
         'executables_copied': 0,
         'errors': []
     }
-    
-    def get_file_checksum(filepath):
-        """Calculate MD5 checksum of a file"""
-        import hashlib
-        hash_md5 = hashlib.md5()
+    usb_changed = True  # assume the worst until the sync has run to completion
+    
+    def get_file_checksum(filepath, manifest, name):
+        """Content checksum of a file, reused from the manifest while its size and mtime are unchanged"""
+        st = os.stat(filepath)
+        entry = manifest.get(name)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        file_hash = _file_hash()
         with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
-
-    def files_are_identical(file1, file2):
-        """Check if two files are identical using size and checksum"""
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                file_hash.update(chunk)
+        checksum = file_hash.hexdigest()
+        manifest[name] = [st.st_size, st.st_mtime_ns, checksum]
+        return checksum
+
+    def files_are_identical(src_file, usb_file, name):
+        """Check if a local executable and its USB copy are identical using size and checksum"""
         try:
             # Quick size check first
-            if os.path.getsize(file1) != os.path.getsize(file2):
+            if os.path.getsize(src_file) != os.path.getsize(usb_file):
                 return False
-            # Detailed checksum comparison
-            return get_file_checksum(file1) == get_file_checksum(file2)
+            # Checksum comparison - free when neither file changed since the last sync
+            return (get_file_checksum(src_file, local_manifest, name) ==
+                    get_file_checksum(usb_file, usb_manifest, name))
         except Exception:
             return False
 
+    def record_copy(src_file, usb_file, name):
+        """Record a freshly copied executable in the USB manifest"""
+        try:
+            st = os.stat(usb_file)
+            usb_manifest[name] = [st.st_size, st.st_mtime_ns, get_file_checksum(src_file, local_manifest, name)]
+        except Exception:
+            usb_manifest.pop(name, None)
+
     try:
-        # Robust executable synchronization using staging process
-        print("Synchronizing executables to USB drive using staging process...")
+        # Executable synchronization: compare in place and atomically replace only what changed
+        print("Synchronizing executables to USB drive...")
         src_exec_dir = os.path.join(parent_dir, 'executables')
         
         if not os.path.isdir(src_exec_dir):
@@ -1108,90 +1835,98 @@ def copy_executables_to_usb(usb_path):
             result['errors'].append(f"Executables directory not found: {src_exec_dir}")
             return result
 
-        # Step 1: Rename all existing files on USB by appending ".orig"
-        print("Step 1: Staging existing USB files...")
-        existing_files = []
-        if os.path.exists(usb_path):
-            for item in os.listdir(usb_path):
-                item_path = os.path.join(usb_path, item)
-                if os.path.isfile(item_path) and not item.endswith('.orig'):
-                    orig_path = f"{item_path}.orig"
-                    try:
-                        os.rename(item_path, orig_path)
-                        existing_files.append(item)
-                        print(f"  Staged: {item} -> {item}.orig")
-                    except Exception as e:
-                        print(f"  Warning: Could not stage {item}: {e}")
+        # Checksums from previous syncs, keyed by filename -> [size, mtime_ns, checksum]
+        local_manifest = _load_exec_manifest(src_exec_dir)
+        usb_manifest = _load_exec_manifest(usb_path)
+        local_manifest_orig = dict(local_manifest)
+        usb_manifest_orig = dict(usb_manifest)
 
-        # Step 2: Process each executable from local directory
-        print("Step 2: Processing local executables...")
-        for fname in os.listdir(src_exec_dir):
+        def sync_executable(fname):
+            """Bring one executable up to date on USB; returns (action, size_mb, error)"""
             src_f = os.path.join(src_exec_dir, fname)
             dst_f = os.path.join(usb_path, fname)
-            orig_f = f"{dst_f}.orig"
+            tmp_f = f"{dst_f}.tmp"
+            exists = os.path.exists(dst_f)
+            if exists and files_are_identical(src_f, dst_f, fname):
+                return 'unchanged', None, None
             
-            # Only process actual executables
-            if (os.path.isfile(src_f) and 
-                (not '.' in fname or fname.endswith('.exe')) and 
-                not fname.endswith('.sha') and 
-                not fname.endswith('.version')):
-                
-                action_taken = None
-                
-                # Check if we have a staged version to compare with
-                if os.path.exists(orig_f):
-                    if files_are_identical(src_f, orig_f):
-                        # Files are identical - restore the original
-                        try:
-                            os.rename(orig_f, dst_f)
-                            action_taken = "restored (identical)"
-                            print(f"  Restored: {fname} (identical to local)")
-                        except Exception as e:
-                            print(f"  Error restoring {fname}: {e}")
-                            action_taken = "error_restoring"
-                    else:
-                        # Files differ - copy new version and remove staged file
-                        try:
-                            shutil.copy2(src_f, dst_f)
-                            os.remove(orig_f)
-                            size_mb = os.path.getsize(dst_f) / (1024 * 1024)
-                            action_taken = "updated"
-                            result['executables_copied'] += 1
-                            print(f"  Updated: {fname} ({size_mb:.2f} MB) - content differs")
-                        except Exception as e:
-                            print(f"  Error updating {fname}: {e}")
-                            action_taken = "error_updating"
+            # Copy next to the target and swap it in atomically, so an interrupted sync
+            # never leaves a missing or half-written executable behind
+            try:
+                _copy_file_kernel(src_f, tmp_f)
+                # Make the new contents durable before the rename exposes them
+                fd = os.open(tmp_f, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_f, dst_f)
+                record_copy(src_f, dst_f, fname)
+                return ('updated' if exists else 'added'), os.path.getsize(dst_f) / (1024 * 1024), None
+            except Exception as e:
+                try:
+                    os.remove(tmp_f)
+                except OSError:
+                    pass
+                return ('updating' if exists else 'adding'), None, e
+
+        # Step 1: Bring each local executable up to date on USB, touching only files that differ
+        print("Step 1: Processing local executables...")
+        # Only process actual executables
+        synced_files = [fname for fname in os.listdir(src_exec_dir)
+                        if (os.path.isfile(os.path.join(src_exec_dir, fname)) and 
+                            (not '.' in fname or fname.endswith('.exe')) and 
+                            not fname.endswith('.sha') and 
+                            not fname.endswith('.version'))]
+        
+        # Several copies in flight keep the USB write queue busy; results are reported from this
+        # thread as they complete (a few workers only - USB bandwidth is the real limit)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {executor.submit(sync_executable, fname): fname for fname in synced_files}
+            for future in concurrent.futures.as_completed(futures):
+                fname = futures[future]
+                action, size_mb, error = future.result()
+                if error is not None:
+                    print(f"  Error {action} {fname}: {error}")
+                elif action == 'unchanged':
+                    print(f"  Unchanged: {fname} (identical to local)")
                 else:
-                    # No staged version - this is a new file
-                    try:
-                        shutil.copy2(src_f, dst_f)
-                        size_mb = os.path.getsize(dst_f) / (1024 * 1024)
-                        action_taken = "added"
-                        result['executables_copied'] += 1
+                    result['executables_copied'] += 1
+                    if action == 'updated':
+                        print(f"  Updated: {fname} ({size_mb:.2f} MB) - content differs")
+                    else:
                         print(f"  Added: {fname} ({size_mb:.2f} MB) - new executable")
-                    except Exception as e:
-                        print(f"  Error adding {fname}: {e}")
-                        action_taken = "error_adding"
 
-        # Step 3: Clean up any remaining .orig files (these are obsolete)
-        print("Step 3: Cleaning up obsolete files...")
+        # Step 2: Remove files on USB that are no longer among the local executables
+        # (including .orig leftovers from the old rename-based staging)
+        print("Step 2: Cleaning up obsolete files...")
+        synced_set = set(synced_files)
         removed_count = 0
-        if os.path.exists(usb_path):
-            for item in os.listdir(usb_path):
-                if item.endswith('.orig'):
-                    orig_path = os.path.join(usb_path, item)
-                    try:
-                        os.remove(orig_path)
-                        removed_count += 1
-                        original_name = item[:-5]  # Remove '.orig' suffix
-                        print(f"  Removed obsolete: {original_name} (no longer needed)")
-                    except Exception as e:
-                        print(f"  Warning: Could not remove obsolete file {item}: {e}")
+        for item in os.listdir(usb_path):
+            item_path = os.path.join(usb_path, item)
+            if item in synced_set or item == EXEC_MANIFEST_FILE or not os.path.isfile(item_path):
+                continue
+            try:
+                os.remove(item_path)
+                removed_count += 1
+                print(f"  Removed obsolete: {item} (no longer needed)")
+            except Exception as e:
+                print(f"  Warning: Could not remove obsolete file {item}: {e}")
         
         if removed_count > 0:
             print(f"Cleaned up {removed_count} obsolete files")
         else:
             print("No obsolete files to clean up")
+        usb_changed = result['executables_copied'] > 0 or removed_count > 0
+
+        # Drop manifest entries for files that no longer exist, then save the manifests if they changed
+        for manifest, manifest_dir, original in ((local_manifest, src_exec_dir, local_manifest_orig),
+                                                 (usb_manifest, usb_path, usb_manifest_orig)):
+            for name in [name for name in manifest if not os.path.isfile(os.path.join(manifest_dir, name))]:
+                del manifest[name]
+            if manifest != original:
+                _save_exec_manifest(manifest_dir, manifest)
+                usb_changed = usb_changed or manifest is usb_manifest
             
         print("✅ USB executable synchronization completed successfully")
         
@@ -1200,14 +1935,14 @@ def copy_executables_to_usb(usb_path):
         print(error_msg)
         result['errors'].append(error_msg)
     
-    # Sync all data to USB drive after copying
+    # Flush the USB filesystem (renames, removals, manifest) if anything on it changed;
+    # copied executables were already fsynced individually, so no settle delay is needed
     try:
-        print("Syncing data to USB drive...")
-        import subprocess
-        import time
-        subprocess.run(['sync'], check=True)
-        time.sleep(2)  # Give extra time for exFAT filesystem
-        print("USB sync completed successfully")
+        if usb_changed:
+            print("Syncing data to USB drive...")
+            if not _syncfs(usb_path):
+                os.sync()
+            print("USB sync completed successfully")
     except Exception as e:
         error_msg = f"Warning: USB sync failed: {e}"
         print(error_msg)
@@ -1215,58 +1950,111 @@ def copy_executables_to_usb(usb_path):
     
     return result
 
+@functools.lru_cache(maxsize=1)
 def get_hardwareid():
     """
     Get the hardware ID using the same logic as the installation script.
     First tries to get CPU serial from /proc/cpuinfo, then falls back to MAC address.
+    The result never changes at runtime, so it is memoized for the process lifetime.
     """
     try:
         # First try to get CPU serial from /proc/cpuinfo (Raspberry Pi)
-        with open('/proc/cpuinfo', 'r') as f:
-            for line in f:
-                if line.startswith('Serial'):
-                    serial = line.split(':')[1].strip()
-                    if serial and serial != '0000000000000000':
-                        return serial
-    except (FileNotFoundError, IOError, IndexError):
+        # Read it in one go and search the bytes rather than iterating lines
+        with open('/proc/cpuinfo', 'rb') as f:
+            data = b'\n' + f.read()
+        idx = data.find(b'\nSerial')
+        if idx != -1:
+            end = data.find(b'\n', idx + 1)
+            line = data[idx + 1:end if end != -1 else len(data)]
+            serial = line.split(b':', 1)[1].strip().decode()
+            if serial and serial != '0000000000000000':
+                return serial
+    except (FileNotFoundError, IOError, IndexError, UnicodeDecodeError):
         pass
     
     # Fallback to MAC address
     try:
-        for interface_path in glob.glob('/sys/class/net/*/address'):
-            try:
-                with open(interface_path, 'r') as f:
-                    mac = f.read().strip()
-                    if mac and mac != '00:00:00:00:00:00':
+        with os.scandir('/sys/class/net') as it:
+            for entry in it:
+                # Skip loopback and virtual interfaces before touching their address files
+                if entry.name == 'lo' or entry.name.startswith(('docker', 'br-', 'veth')):
+                    continue
+                try:
+                    mac = _read_small_file(f'{entry.path}/address', 64).strip()
+                    if mac and mac != b'00:00:00:00:00:00':
                         # Remove colons like in the installation script
-                        return mac.replace(':', '')
-            except (IOError, OSError):
-                continue
+                        return mac.replace(b':', b'').decode()
+                except (IOError, OSError):
+                    continue
     except Exception:
         pass
     
     # Final fallback - generate based on timestamp like installation script
     return f"fallback-{int(time.time())}"
 
+# Directories that never contain shipped source files
+_APP_VERSION_SKIP_DIRS = {'__pycache__', '.git', 'streamerData', 'node_modules', '.venv', 'venv', '.mypy_cache', '.pytest_cache'}
+
+def _iter_source_files(root, exts=('.py', '.html', '.png')):
+    """Yield DirEntry objects for source files under root (iterative scandir, skipping non-source dirs)"""
+    stack = deque([root])
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _APP_VERSION_SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.lower().endswith(exts) and entry.is_file():
+                    yield entry
+
+# get_app_version result; rescanned after APP_VERSION_CACHE_TTL seconds or as soon as the
+# project directory itself changes (updates replace files by rename, which bumps its mtime)
+APP_VERSION_CACHE_TTL = 60
+_app_version_cache = {'t': 0.0, 'dir_mtime': None, 'v': None}
+
 def get_app_version():
-    """Get the application version based on latest file modification time"""
-    # Find the latest mtime among all .py, .html, .png files in the project
-    exts = {'.py', '.html', '.png'}
-    latest_mtime = 0
-    latest_file = ''
-    for root, dirs, files in os.walk(os.path.dirname(__file__)):
-        for f in files:
-            ext = os.path.splitext(f)[1].lower()
-            if ext in exts:
-                path = os.path.join(root, f)
-                mtime = os.path.getmtime(path)
-                if mtime > latest_mtime:
-                    latest_mtime = mtime
-                    latest_file = path
-    if latest_mtime:
-        mtime_dt = datetime.fromtimestamp(latest_mtime)
-        return mtime_dt.strftime('%Y-%m-%d %H:%M')
-    return ''
+    """Get the application version based on latest file modification time (cached, see APP_VERSION_CACHE_TTL)"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    try:
+        dir_mtime = os.stat(root).st_mtime_ns
+    except OSError:
+        dir_mtime = None
+    now = time.monotonic()
+    if (_app_version_cache['v'] is not None and dir_mtime == _app_version_cache['dir_mtime'] and
+            now - _app_version_cache['t'] < APP_VERSION_CACHE_TTL):
+        return _app_version_cache['v']
+    
+    # DirEntry caches the stat result, so this is the only stat per file
+    latest_mtime = max((entry.stat().st_mtime for entry in _iter_source_files(root)), default=0)
+    version = datetime.fromtimestamp(latest_mtime).strftime('%Y-%m-%d %H:%M') if latest_mtime else ''
+    _app_version_cache.update(t=now, dir_mtime=dir_mtime, v=version)
+    return version
+
+# Parsed small JSON config files (wifi.json, cellular.json) keyed by path -> ((mtime_ns, size), dict)
+_json_file_cache = {}
+
+def _load_json_cached(path, parse):
+    """
+    Return a copy of the dict parsed from path with parse(binary_file), or None if the file is missing.
+    The parsed result is reused until the file's mtime or size changes.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _json_file_cache.pop(path, None)
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _json_file_cache.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, 'rb') as f:
+            cached = (key, parse(f))
+        _json_file_cache[path] = cached
+    # Callers merge defaults into and modify the result, so never hand out the cached object
+    return dict(cached[1])
 
 def load_wifi_settings():
     """Load WiFi settings from wifi.json with defaults"""
@@ -1282,18 +2070,17 @@ def load_wifi_settings():
         "manual_password": ""  # User's manual WiFi password
     }
     
-    if os.path.exists(wifi_path):
-        try:
-            with open(wifi_path, 'r') as f:
-                wifi_settings = json.load(f)
-                # Merge with defaults to ensure all keys exist
-                for key, default_value in wifi_defaults.items():
-                    if key not in wifi_settings:
-                        wifi_settings[key] = default_value
-                return wifi_settings
-        except (json.JSONDecodeError, ValueError):
-            # Silent error handling in utils
-            pass
+    try:
+        wifi_settings = _load_json_cached(wifi_path, _jload)
+        if wifi_settings is not None:
+            # Merge with defaults to ensure all keys exist
+            for key, default_value in wifi_defaults.items():
+                if key not in wifi_settings:
+                    wifi_settings[key] = default_value
+            return wifi_settings
+    except (json.JSONDecodeError, ValueError):
+        # Silent error handling in utils
+        pass
     
     return wifi_defaults
 
@@ -1302,97 +2089,196 @@ def save_wifi_settings(wifi_settings):
     wifi_path = os.path.join(STREAMER_DATA_DIR, 'wifi.json')
     try:
         os.makedirs(STREAMER_DATA_DIR, exist_ok=True)
-        with open(wifi_path, 'w') as f:
-            json.dump(wifi_settings, f, indent=2)
+        with open(wifi_path, 'wb') as f:
+            f.write(_jdumps(wifi_settings))
     except Exception:
         # Silent error handling in utils - let calling code handle errors
         pass
+    _json_file_cache.pop(wifi_path, None)
+    invalidate_wifi_status_cache()
+
+_nm_client = None
+# NM.Client and its GLib main context are not thread-safe; creation, dispatch and reads
+# all happen under this lock
+_nm_lock = threading.Lock()
+
+def _get_nm_client():
+    """Return a shared libnm client, or None if libnm/NetworkManager is unavailable. Call with _nm_lock held."""
+    global _nm_client
+    if NM is None:
+        return None
+    if _nm_client is None:
+        try:
+            _nm_client = NM.Client.new(None)
+        except Exception:
+            return None
+    # No GLib main loop runs in this process, so dispatch any pending D-Bus
+    # property updates before reading the client's cached state
+    context = _nm_client.get_main_context()
+    while context.pending():
+        context.iteration(False)
+    return _nm_client
+
+def _count_hotspot_stations():
+    """Count stations associated with the wlan0 access point (station dump is readable without root)"""
+    returncode, stdout = _run_command(['iw', 'dev', 'wlan0', 'station', 'dump'], 3)
+    return stdout.count(b'Station ') if returncode == 0 else 0
+
+def _get_wifi_state_nm():
+    """
+    Read wlan0 state over D-Bus using libnm.
+    Returns (wifi_connected, current_ssid, current_ip, hotspot_active, client_count, signal_percent)
+    or None if libnm is not available.
+    """
+    with _nm_lock:
+        client = _get_nm_client()
+        if client is None:
+            return None
+
+        device = client.get_device_by_iface('wlan0')
+        if not isinstance(device, NM.DeviceWifi):
+            return False, None, None, False, 0, None
+
+        active_connection = device.get_active_connection()
+        current_ssid = active_connection.get_id() if active_connection else None
+        ip4_config = device.get_ip4_config()
+        addresses = ip4_config.get_addresses() if ip4_config else []
+        current_ip = addresses[0].get_address() if addresses else None
+
+        if not (current_ssid and current_ip):
+            return False, current_ssid, None, False, 0, None
+
+        hotspot_active = device.get_mode() == getattr(NM, '80211Mode').AP
+        signal_percent = None
+        if not hotspot_active:
+            access_point = device.get_active_access_point()
+            if access_point is not None:
+                signal_percent = access_point.get_strength()
+
+    # ARP entries linger after a client disconnects, so count associated stations instead
+    client_count = _count_hotspot_stations() if hotspot_active else 0
+
+    return True, current_ssid, current_ip, hotspot_active, client_count, signal_percent
+
+def _spawn_command(cmd):
+    """Start cmd with stdout captured; returns the Popen, or None if it could not be started"""
+    try:
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError:
+        return None
 
-def get_wifi_mode_status():
-    """Get current WiFi mode and connection status using simplified NetworkManager commands"""
-    wifi_settings = load_wifi_settings()
-    
-    # Default values
-    wifi_mode = 'client'
+def _collect_command(proc, timeout):
+    """
+    Wait for a process started by _spawn_command. Returns (returncode, stdout) or (None, b'') on failure.
+    stdout is left as bytes; callers decode only the fields they keep.
+    """
+    if proc is None:
+        return None, b''
+    try:
+        stdout, _ = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        return None, b''
+    return proc.returncode, stdout
+
+def _run_command(cmd, timeout):
+    """Run cmd to completion; see _collect_command for the return value"""
+    return _collect_command(_spawn_command(cmd), timeout)
+
+def _get_wifi_state_nmcli():
+    """
+    Read wlan0 state by running nmcli/iw (fallback when libnm is unavailable).
+    The mode and signal queries run concurrently once the connection name is known.
+    Returns (wifi_connected, current_ssid, current_ip, hotspot_active, client_count, signal_percent).
+    """
     hotspot_active = False
     current_ip = None
     current_ssid = None
-    wifi_connected = False
+    client_count = 0
+    signal_percent = None
+    
+    # Get connection name and IP address directly
+    returncode, stdout = _run_command(['nmcli', '-g', 'GENERAL.CONNECTION,IP4.ADDRESS', 'device', 'show', 'wlan0'], 5)
+    if returncode == 0:
+        lines = stdout.strip().splitlines()
+        if len(lines) >= 2:
+            ssid = lines[0].strip()
+            ip_with_mask = lines[1].strip()
+            current_ssid = ssid.decode(errors='replace') if ssid and ssid != b'--' else None
+            if ip_with_mask and ip_with_mask != b'--':
+                current_ip = ip_with_mask.split(b'/')[0].decode('ascii')  # Remove subnet mask
+    
+    if not (current_ssid and current_ip):
+        return False, current_ssid, None, False, 0, None
+    
+    # Check WiFi mode using the connection name, and fetch client-mode signal strength
+    # at the same time so the two nmcli processes overlap
+    mode_proc = _spawn_command(['nmcli', '-g', '802-11-wireless.mode', 'connection', 'show', current_ssid])
+    # --rescan no: report the cached scan instead of triggering a 1-3s rescan
+    wifi_proc = _spawn_command(['nmcli', '-g', 'IN-USE,SIGNAL', 'device', 'wifi', 'list', '--rescan', 'no'])
+    mode_rc, mode_out = _collect_command(mode_proc, 3)
+    wifi_rc, wifi_out = _collect_command(wifi_proc, 3)
+    if mode_rc == 0:
+        hotspot_active = b'ap' in mode_out.strip().lower()
+    
+    if hotspot_active:
+        client_count = _count_hotspot_stations()
+    elif wifi_rc == 0:
+        for line in wifi_out.splitlines():
+            if line[:2] != b'*:':  # Only the currently connected network is of interest
+                continue
+            signal = line.rpartition(b':')[2]
+            signal_percent = int(signal) if signal.isdigit() else None
+            break
+    
+    return True, current_ssid, current_ip, hotspot_active, client_count, signal_percent
+
+# Short-lived cache of the last WiFi status so status-page polling doesn't re-query NetworkManager
+WIFI_STATUS_CACHE_TTL = 2.0
+_wifi_status_cache = {'t': 0.0, 'v': None}
+
+def invalidate_wifi_status_cache():
+    """Drop the cached WiFi status (call after changing WiFi settings or NetworkManager state)"""
+    _wifi_status_cache['v'] = None
+    _wifi_status_cache['t'] = 0.0
+
+def _get_cached_wifi_status():
+    """Return a copy of the cached WiFi status if it is still fresh, else None"""
+    if (_wifi_status_cache['v'] is not None and
+            time.monotonic() - _wifi_status_cache['t'] < WIFI_STATUS_CACHE_TTL):
+        return dict(_wifi_status_cache['v'])
+    return None
+
+def get_wifi_mode_status():
+    """Get current WiFi mode and connection status from NetworkManager (libnm over D-Bus, nmcli as fallback)"""
+    cached = _get_cached_wifi_status()
+    if cached is not None:
+        return cached
+    
+    wifi_settings = load_wifi_settings()
     
+    state = None
     try:
-        # Get connection name and IP address directly
-        result = subprocess.run(['nmcli', '-g', 'GENERAL.CONNECTION,IP4.ADDRESS', 'device', 'show', 'wlan0'], 
-                              capture_output=True, text=True, timeout=5)
-        
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            if len(lines) >= 2:
-                current_ssid = lines[0].strip() if lines[0].strip() != '--' else None
-                ip_with_mask = lines[1].strip() if lines[1].strip() != '--' else None
-                
-                if current_ssid and ip_with_mask:
-                    wifi_connected = True
-                    current_ip = ip_with_mask.split('/')[0]  # Remove subnet mask
-                    
-                    # Check WiFi mode using the connection name
-                    try:
-                        mode_result = subprocess.run(['nmcli', '-g', '802-11-wireless.mode', 
-                                                    'connection', 'show', current_ssid], 
-                                                   capture_output=True, text=True, timeout=3)
-                        
-                        if mode_result.returncode == 0:
-                            mode_output = mode_result.stdout.strip().lower()
-                            if 'ap' in mode_output:
-                                wifi_mode = 'hotspot'
-                                hotspot_active = True
-                            else:
-                                wifi_mode = 'client'
-                                hotspot_active = False
-                                
-                    except Exception:
-                        # Silent fallback - don't print errors in utils
-                        pass
-            
+        state = _get_wifi_state_nm()
     except Exception:
-        # Silent error handling in utils
+        # D-Bus query failed - fall back to nmcli
         pass
+    if state is None:
+        try:
+            state = _get_wifi_state_nmcli()
+        except Exception:
+            # Silent error handling in utils
+            state = (False, None, None, False, 0, None)
+    wifi_connected, current_ssid, current_ip, hotspot_active, client_count, signal_percent = state
     
-    # Additional information based on mode
-    client_count = 0
     signal_strength = None
-    signal_percent = None
+    if signal_percent is not None:
+        # Convert percentage to approximate dBm (reverse of our earlier calculation)
+        signal_strength = int((signal_percent * 60 / 100) - 90)
     
-    if wifi_connected:
-        if hotspot_active:
-            # Count connected clients for hotspot mode
-            try:
-                # Count connected clients using iw command
-                clients_result = subprocess.run(['sudo', 'iw', 'dev', 'wlan0', 'station', 'dump'], 
-                                              capture_output=True, text=True, timeout=3)
-                if clients_result.returncode == 0:
-                    client_count = clients_result.stdout.count('Station ')
-            except Exception:
-                client_count = 0
-        else:
-            # Client mode - get signal strength using nmcli
-            try:
-                wifi_result = subprocess.run(['nmcli', '-g', 'IN-USE,SSID,SIGNAL', 'device', 'wifi', 'list'], 
-                                           capture_output=True, text=True, timeout=3)
-                if wifi_result.returncode == 0:
-                    for line in wifi_result.stdout.strip().split('\n'):
-                        if line.startswith('*:'):  # Currently connected network
-                            parts = line.split(':')
-                            if len(parts) >= 3:
-                                signal_percent = int(parts[2]) if parts[2].isdigit() else None
-                                if signal_percent is not None:
-                                    # Convert percentage to approximate dBm (reverse of our earlier calculation)
-                                    signal_strength = int((signal_percent * 60 / 100) - 90)
-                                break
-            except Exception:
-                pass
-    
-    return {
-        'mode': wifi_mode,
+    result = {
+        'mode': 'hotspot' if hotspot_active else 'client',
         'hotspot_active': hotspot_active,
         'current_ip': current_ip,
         'current_ssid': current_ssid,
@@ -1403,6 +2289,9 @@ def get_wifi_mode_status():
         'signal_strength': signal_strength,
         'signal_percent': int(signal_percent) if signal_percent is not None else None
     }
+    _wifi_status_cache['v'] = result
+    _wifi_status_cache['t'] = time.monotonic()
+    return dict(result)
 
 # =============================================================================
 # Cellular Settings Functions
@@ -1421,18 +2310,17 @@ def load_cellular_settings():
         "cellular_mnc": ""
     }
     
-    if os.path.exists(cellular_path):
-        try:
-            with open(cellular_path, 'r') as f:
-                cellular_settings = json.load(f)
-                # Merge with defaults to ensure all keys exist
-                for key, default_value in cellular_defaults.items():
-                    if key not in cellular_settings:
-                        cellular_settings[key] = default_value
-                return cellular_settings
-        except (json.JSONDecodeError, ValueError):
-            # Silent error handling in utils
-            pass
+    try:
+        cellular_settings = _load_json_cached(cellular_path, _jload)
+        if cellular_settings is not None:
+            # Merge with defaults to ensure all keys exist
+            for key, default_value in cellular_defaults.items():
+                if key not in cellular_settings:
+                    cellular_settings[key] = default_value
+            return cellular_settings
+    except (json.JSONDecodeError, ValueError):
+        # Silent error handling in utils
+        pass
     
     return cellular_defaults
 
@@ -1441,11 +2329,16 @@ def save_cellular_settings(cellular_settings):
     cellular_path = os.path.join(STREAMER_DATA_DIR, 'cellular.json')
     try:
         os.makedirs(STREAMER_DATA_DIR, exist_ok=True)
-        with open(cellular_path, 'w') as f:
-            json.dump(cellular_settings, f, indent=2)
+        with open(cellular_path, 'wb') as f:
+            f.write(_jdumps(cellular_settings))
     except Exception:
         # Silent error handling in utils - let calling code handle errors
         pass
+    _json_file_cache.pop(cellular_path, None)
+
+# ModemManager object path in `mmcli -L` output and RSSI line in `mmcli --signal-get` output (matched against raw bytes)
+_MODEM_RE = re.compile(rb'/org/freedesktop/ModemManager1/Modem/(\d+)')
+_RSSI_RE = re.compile(rb'rssi:\s*(-?\d+)', re.IGNORECASE)
 
 def get_cellular_status():
     """Get current cellular modem status using NetworkManager"""
@@ -1462,42 +2355,41 @@ def get_cellular_status():
     try:
         # Get cellular device status
         result = subprocess.run(['nmcli', '-f', 'GENERAL.DEVICE,GENERAL.STATE,IP4.ADDRESS', 
-                               'device', 'show'], capture_output=True, text=True, timeout=10)
+                               'device', 'show'], capture_output=True, timeout=10)
         
         if result.returncode == 0:
-            lines = result.stdout.split('\n')
+            # Parse the raw bytes and decode only the fields that are kept
             current_device = None
             
-            for line in lines:
+            for line in result.stdout.splitlines():
                 line = line.strip()
-                if line.startswith('GENERAL.DEVICE:') and 'wwan' in line:
-                    current_device = line.split(':')[1].strip()
-                    modem_device = current_device
-                elif line.startswith('GENERAL.STATE:') and current_device and 'wwan' in current_device:
-                    state = line.split(':')[1].strip()
-                    cellular_connected = 'connected' in state.lower()
-                elif line.startswith('IP4.ADDRESS[1]:') and current_device and 'wwan' in current_device:
-                    ip_info = line.split(':')[1].strip()
-                    if ip_info and '/' in ip_info:
-                        current_ip = ip_info.split('/')[0]
+                if line.startswith(b'GENERAL.DEVICE:') and b'wwan' in line:
+                    current_device = line.split(b':')[1].strip()
+                    modem_device = current_device.decode(errors='replace')
+                elif line.startswith(b'GENERAL.STATE:') and current_device and b'wwan' in current_device:
+                    state = line.split(b':')[1].strip()
+                    cellular_connected = b'connected' in state.lower()
+                elif line.startswith(b'IP4.ADDRESS[1]:') and current_device and b'wwan' in current_device:
+                    ip_info = line.split(b':')[1].strip()
+                    if ip_info and b'/' in ip_info:
+                        current_ip = ip_info.split(b'/')[0].decode('ascii')
         
         # Try to get signal strength and operator info using ModemManager if available
         try:
-            mm_result = subprocess.run(['mmcli', '-L'], capture_output=True, text=True, timeout=5)
-            if mm_result.returncode == 0 and 'Modem/' in mm_result.stdout:
+            mm_result = subprocess.run(['mmcli', '-L'], capture_output=True, timeout=5)
+            if mm_result.returncode == 0 and b'Modem/' in mm_result.stdout:
                 # Extract modem number (usually 0)
-                import re
-                modem_match = re.search(r'/org/freedesktop/ModemManager1/Modem/(\d+)', mm_result.stdout)
+                modem_match = _MODEM_RE.search(mm_result.stdout)
                 if modem_match:
-                    modem_id = modem_match.group(1)
+                    modem_id = modem_match.group(1).decode('ascii')
                     
                     # Get signal strength
                     signal_result = subprocess.run(['mmcli', '-m', modem_id, '--signal-get'], 
-                                                 capture_output=True, text=True, timeout=5)
+                                                 capture_output=True, timeout=5)
                     if signal_result.returncode == 0:
-                        for line in signal_result.stdout.split('\n'):
-                            if 'rssi:' in line.lower():
-                                rssi_match = re.search(r'rssi:\s*(-?\d+)', line)
+                        for line in signal_result.stdout.splitlines():
+                            if b'rssi:' in line.lower():
+                                rssi_match = _RSSI_RE.search(line)
                                 if rssi_match:
                                     rssi = int(rssi_match.group(1))
                                     # Convert RSSI to percentage (approximate)
@@ -1505,13 +2397,14 @@ def get_cellular_status():
                     
                     # Get operator and access technology
                     status_result = subprocess.run(['mmcli', '-m', modem_id], 
-                                                 capture_output=True, text=True, timeout=5)
+                                                 capture_output=True, timeout=5)
                     if status_result.returncode == 0:
-                        for line in status_result.stdout.split('\n'):
-                            if 'operator name:' in line.lower():
-                                operator_name = line.split(':')[1].strip().strip("'\"")
-                            elif 'access tech:' in line.lower():
-                                access_technology = line.split(':')[1].strip().strip("'\"")
+                        for line in status_result.stdout.splitlines():
+                            lowered = line.lower()
+                            if b'operator name:' in lowered:
+                                operator_name = line.split(b':')[1].strip().strip(b"'\"").decode(errors='replace')
+                            elif b'access tech:' in lowered:
+                                access_technology = line.split(b':')[1].strip().strip(b"'\"").decode(errors='replace')
         
         except Exception:
             # ModemManager not available or failed
@@ -1534,27 +2427,29 @@ def get_cellular_status():
 def update_cellular_connection(cellular_settings):
     """Update NetworkManager cellular connection with new settings"""
     try:
-        # Update NetworkManager cellular connection with new settings
-        subprocess.run(['sudo', 'nmcli', 'connection', 'modify', 'cellular-auto', 
-                       'gsm.apn', cellular_settings['cellular_apn']], check=False)
-        subprocess.run(['sudo', 'nmcli', 'connection', 'modify', 'cellular-auto', 
-                       'gsm.username', cellular_settings['cellular_username']], check=False)
-        subprocess.run(['sudo', 'nmcli', 'connection', 'modify', 'cellular-auto', 
-                       'gsm.password', cellular_settings['cellular_password']], check=False)
+        # Update NetworkManager cellular connection with new settings in a single nmcli call
+        modify_base = ['sudo', 'nmcli', 'connection', 'modify', 'cellular-auto']
+        properties = [('gsm.apn', cellular_settings['cellular_apn']),
+                      ('gsm.username', cellular_settings['cellular_username']),
+                      ('gsm.password', cellular_settings['cellular_password'])]
         
         # Handle MCC and MNC if provided
         if cellular_settings['cellular_mcc'] and cellular_settings['cellular_mnc']:
-            subprocess.run(['sudo', 'nmcli', 'connection', 'modify', 'cellular-auto', 
-                           'gsm.home-only', 'yes'], check=False)
-            subprocess.run(['sudo', 'nmcli', 'connection', 'modify', 'cellular-auto', 
-                           'gsm.network-id', f"{cellular_settings['cellular_mcc']}{cellular_settings['cellular_mnc']}"], 
-                          check=False)
+            properties += [('gsm.home-only', 'yes'),
+                           ('gsm.network-id', f"{cellular_settings['cellular_mcc']}{cellular_settings['cellular_mnc']}")]
         else:
-            # Allow automatic network selection if no MCC/MNC specified
-            subprocess.run(['sudo', 'nmcli', 'connection', 'modify', 'cellular-auto', 
-                           'gsm.home-only', 'no'], check=False)
-            subprocess.run(['sudo', 'nmcli', 'connection', 'modify', 'cellular-auto', 
-                           '--remove', 'gsm.network-id'], check=False)
+            # Allow automatic network selection if no MCC/MNC specified (empty value clears the network id)
+            properties += [('gsm.home-only', 'no'), ('gsm.network-id', '')]
+        
+        result = subprocess.run(modify_base + [arg for prop in properties for arg in prop], check=False)
+        if result.returncode != 0:
+            # nmcli rejects the whole call if any one property is rejected (e.g. an empty
+            # gsm.network-id on older NetworkManager); apply them one at a time so the rest still take effect
+            for name, value in properties:
+                if name == 'gsm.network-id' and not value:
+                    subprocess.run(modify_base + ['--remove', 'gsm.network-id'], check=False)
+                else:
+                    subprocess.run(modify_base + [name, value], check=False)
         
         subprocess.run(['sudo', 'nmcli', 'connection', 'reload'], check=False)
         print(f"Updated NetworkManager cellular settings - APN: '{cellular_settings['cellular_apn']}', "
@@ -1579,16 +2474,24 @@ def find_working_at_port():
     """
     logger = logging.getLogger('at_port_finder')
     
-    # Get list of all available serial ports
+    # Get list of all available serial ports (ttyUSBn and ttyACMn) from a single /dev listing
     available_ports = []
-    for i in range(10):  # Check ttyUSB0-9 and ttyACM0-9
-        for prefix in ['/dev/ttyUSB', '/dev/ttyACM']:
-            port_path = f"{prefix}{i}"
-            if os.path.exists(port_path):
-                available_ports.append(port_path)
+    try:
+        with os.scandir('/dev') as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(('ttyUSB', 'ttyACM')) and name[6:].isdigit():
+                    available_ports.append(name)
+    except OSError:
+        pass
+    # Probe in the same order as before: ttyUSB0, ttyACM0, ttyUSB1, ...
+    available_ports.sort(key=lambda name: (int(name[6:]), name[3:6] != 'USB'))
+    available_ports = ['/dev/' + name for name in available_ports]
     
     logger.info(f"Testing AT communication on available ports: {available_ports}")
     
+    # Probe sequentially in priority order and stop at the first port that answers, so ports
+    # past it (GPS NMEA output, ports held by ModemManager) are never written to
     for port in available_ports:
         try:
             logger.info(f"Testing AT communication on {port}...")
@@ -1607,10 +2510,14 @@ def find_working_at_port():
     logger.error("✗ Could not find any working AT command port")
     return None
 
+# Final result code of an AT response, as a complete line anywhere in the accumulated bytes
+_AT_FINAL_RE = re.compile(rb'(?:^|[\r\n])(?:OK|ERROR|\+CM[ES] ERROR[^\r\n]*)\r?\n')
+
 def send_at_command(serial_port, command, timeout=10):
     """Send AT command and wait for complete response"""
     logger = logging.getLogger('modem_at_command')
     
+    original_timeout = serial_port.timeout
     try:
         # Clear any pending data
         serial_port.reset_input_buffer()
@@ -1618,22 +2525,26 @@ def send_at_command(serial_port, command, timeout=10):
         # Send command
         serial_port.write(f"{command}\r\n".encode('ascii'))
         
-        # Poll for response
-        response_lines = []
-        start_time = time.time()
+        # Block on readline until each response line arrives, bounded by the overall deadline.
+        # The read timeout is set once (each assignment reconfigures the tty) and kept short
+        # so the deadline is checked regularly. Raw bytes are accumulated and decoded once at the end.
+        buf = bytearray()
+        deadline = time.monotonic() + timeout
+        serial_port.timeout = min(0.5, timeout)
         
-        while time.time() - start_time < timeout:
-            if serial_port.in_waiting > 0:
-                line = serial_port.readline().decode('ascii', errors='ignore').strip()
-                if line:
-                    response_lines.append(line)
-                    
-                    # Check for completion indicators
-                    if line in ['OK', 'ERROR'] or line.startswith('+CME ERROR') or line.startswith('+CMS ERROR'):
-                        break
-            else:
-                time.sleep(0.1)  # Small delay to avoid busy waiting
+        while time.monotonic() < deadline:
+            raw = serial_port.readline()
+            if not raw:
+                continue
+            # A read timeout can split a line across readline() calls, so check the
+            # accumulated bytes for the final result code rather than each chunk
+            scan_from = max(buf.rfind(b'\n'), 0)  # start of the last (possibly partial) line
+            buf += raw
+            if _AT_FINAL_RE.search(buf, scan_from):
+                break
         
+        response_lines = [line.strip() for line in buf.decode('ascii', errors='ignore').splitlines()]
+        response_lines = [line for line in response_lines if line]
         response = '\n'.join(response_lines)
         
         if not response_lines:
@@ -1650,6 +2561,12 @@ def send_at_command(serial_port, command, timeout=10):
     except Exception as e:
         logger.error(f"✗ Exception sending AT command {command}: {e}")
         return None, False
+    finally:
+        # Restore the caller's read timeout
+        try:
+            serial_port.timeout = original_timeout
+        except Exception:
+            pass
 
 def reset_modem_at_command():
     """
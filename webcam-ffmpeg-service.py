@@ -1,10 +1,45 @@
 #!/usr/bin/env python3
 import os
+import json
+import re
+import select
+import shlex
+import shutil
 import subprocess
 import sys
 import time
-import threading
-from utils import list_audio_inputs, list_video_inputs, get_setting
+from utils import list_audio_inputs, list_video_inputs, get_settings, SETTINGS_FILE
+
+# Watch settings.json and camera/audio hotplug events when available (falls back to polling)
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+# ALSA card number in device strings like 'hw:1,0' or 'plughw:1,0'
+_HW_RE = re.compile(r'(?:plug)?hw:(\d+)')
+
+# Hardware encoder probe results, kept on tmpfs so service restarts skip the probe until the next boot
+ENCODER_CACHE_FILE = '/run/rpi-streamer/encoder.cache'
+
+def _encoder_cache_version():
+    """
+    Identify the software the probe results depend on: the kernel release plus the ffmpeg and
+    gst-launch binaries (path and mtime, so a package upgrade invalidates the cache without a reboot).
+    """
+    parts = [os.uname().release]
+    for tool in ('ffmpeg', 'gst-launch-1.0'):
+        path = shutil.which(tool)
+        try:
+            parts.append(f'{path}@{os.stat(path).st_mtime_ns}' if path else f'{tool}:missing')
+        except OSError:
+            parts.append(f'{tool}:missing')
+    return '|'.join(parts)
 
 def start(stream_name):
     if not stream_name:
@@ -13,12 +48,35 @@ def start(stream_name):
     
     static_img = os.path.join(os.path.dirname(__file__), 'no_camera.png')
 
-    def find_usb_audio_device():
+    # Encoder probe verdicts keyed by probe input; encoder support doesn't change while running.
+    # A cache written for a different kernel/ffmpeg/GStreamer is discarded.
+    cache_version = _encoder_cache_version()
+    try:
+        with open(ENCODER_CACHE_FILE, 'r') as f:
+            probe_cache = json.load(f)
+        if not isinstance(probe_cache, dict) or probe_cache.get('version') != cache_version:
+            probe_cache = {}
+    except (OSError, ValueError):
+        probe_cache = {}
+    probe_cache['version'] = cache_version
+
+    def cache_probe_result(key, value):
+        probe_cache[key] = value
+        try:
+            os.makedirs(os.path.dirname(ENCODER_CACHE_FILE), exist_ok=True)
+            tmp_path = f"{ENCODER_CACHE_FILE}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(probe_cache, f)
+            os.replace(tmp_path, ENCODER_CACHE_FILE)
+        except OSError:
+            # Not writable (e.g. not running as root) - keep the in-memory cache only
+            pass
+
+    def find_usb_audio_device(configured_device):
         """
-        Return audio_input if set and available, else None.
+        Return configured_device (the audio_input setting) if set and available, else None.
         If audio_input is 'auto-detect', automatically select the best available device.
         """
-        configured_device = get_setting('audio_input')
         if not configured_device:
             return None
             
@@ -61,12 +119,11 @@ def start(stream_name):
         # Device not found in available devices
         return None
     
-    def find_video_device():
+    def find_video_device(configured_device):
         """
-        Return video_input if set and available, else None.
+        Return configured_device (the video_input setting) if set and available, else None.
         If video_input is 'auto-detect', automatically select the first available video device.
         """
-        configured_device = get_setting('video_input')
         if not configured_device:
             return None
             
@@ -86,17 +143,13 @@ def start(stream_name):
         # Device not found in available devices
         return None
 
-    def build_gstreamer_cmd(video_device, audio_device, framerate_val, resolution_val, crf_val, gop_val, vbitrate_val, ar_val, abitrate_val, volume_val, mirror_vertical_val, stream_name=None):
+    def build_gstreamer_cmd(video_device, audio_device, framerate_val, resolution_val, crf_val, gop_val, vbitrate_val, ar_val, abitrate_val, volume_val, mirror_vertical_val, stabilization, stream_name=None):
         # Switch to control output format: True for WHIP, False for SRT
         usewhip = False
 
-        # Get stabilization setting
-        stabilization = get_setting('video_stabilization')
-
         # Set hardware volume using amixer if audio_device and volume are set
         if audio_device and volume_val is not None:
-            import re
-            m = re.search(r'(?:plug)?hw:(\d+)', str(audio_device))
+            m = _HW_RE.search(str(audio_device))
             if m:
                 cardnum = m.group(1)
                 try:
@@ -111,23 +164,28 @@ def start(stream_name):
         def probe_hardware_encoder_pars(crf_val, gop_val, vbitrate_val):
             # Actually test v4l2h264enc by running a minimal pipeline with simplified controls
             encoder = 'v4l2h264enc'
-            test_cmd = [
-                'gst-launch-1.0',
-                'videotestsrc', 'num-buffers=10', '!',
-                'video/x-raw,width=320,height=240,framerate=5/1', '!',
-                f'{encoder}', '!',
-                'video/x-h264,profile=baseline', '!',
-                'fakesink'
-            ]
-            try:
-                result = subprocess.run(test_cmd, capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    print(f"Hardware encoder {encoder} test succeeded, using it.")
-                    return f'{encoder}'
-                else:
-                    print(f"Hardware encoder {encoder} test failed, return code {result.returncode}.")
-            except Exception as e:
-                print(f"{encoder} test pipeline failed: {e}")
+            cache_key = f'gstreamer:{encoder}'
+            if cache_key not in probe_cache:
+                test_cmd = [
+                    'gst-launch-1.0',
+                    'videotestsrc', 'num-buffers=10', '!',
+                    'video/x-raw,width=320,height=240,framerate=5/1', '!',
+                    f'{encoder}', '!',
+                    'video/x-h264,profile=baseline', '!',
+                    'fakesink'
+                ]
+                try:
+                    result = subprocess.run(test_cmd, capture_output=True, text=True, timeout=10)
+                    if result.returncode == 0:
+                        print(f"Hardware encoder {encoder} test succeeded, using it.")
+                    else:
+                        print(f"Hardware encoder {encoder} test failed, return code {result.returncode}.")
+                    cache_probe_result(cache_key, result.returncode == 0)
+                except Exception as e:
+                    # Timeouts and launch errors may be transient, so they are not cached
+                    print(f"{encoder} test pipeline failed: {e}")
+            if probe_cache.get(cache_key):
+                return f'{encoder}'
             print("Hardware encoder not supported or failed, falling back to x264enc")
             if crf_val not in (None, '', 0, '0'):
                 # Use CRF mode for x264enc
@@ -139,10 +197,17 @@ def start(stream_name):
         # Parse resolution
         width, height = map(int, str(resolution_val).split('x'))
         
+        def color_converter(encoder_pars):
+            """
+            Pick the I420 conversion element. With the hardware encoder available the bcm2835 codec
+            block is present, so v4l2convert (ISP) can do it instead of the CPU-bound videoconvert.
+            """
+            return 'v4l2convert' if encoder_pars == 'v4l2h264enc' else 'videoconvert'
+
         # Helper function to build video processing chain
-        def build_video_processing_chain():
+        def build_video_processing_chain(encoder_pars):
             """Build the video processing pipeline with optional stabilization and mirroring"""
-            chain = 'videoconvert ! video/x-raw,format=I420'
+            chain = f'{color_converter(encoder_pars)} ! video/x-raw,format=I420'
             if stabilization:
                 # Add video stabilization - using videostabilize element
                 chain += ' ! videostabilize'
@@ -151,9 +216,9 @@ def start(stream_name):
                 chain += ' ! videoflip method=vertical-flip'
             return chain
         
-        def build_static_video_processing_chain():
+        def build_static_video_processing_chain(encoder_pars):
             """Build the static image processing pipeline (no stabilization needed, but mirroring if enabled)"""
-            chain = 'videoconvert ! video/x-raw,format=I420'
+            chain = f'{color_converter(encoder_pars)} ! video/x-raw,format=I420'
             if mirror_vertical_val:
                 # Add vertical mirror (flip) - using videoflip element
                 chain += ' ! videoflip method=vertical-flip'
@@ -162,7 +227,7 @@ def start(stream_name):
         if video_device and audio_device:
             # Both video and audio available
             encoder_pars = probe_hardware_encoder_pars(crf_val, gop_val, vbitrate_val)
-            video_processing = build_video_processing_chain()
+            video_processing = build_video_processing_chain(encoder_pars)
             if usewhip:
                 video_part = f'v4l2src device={video_device} ! image/jpeg,width={width},height={height},framerate={framerate_val}/1 ! jpegdec ! {video_processing} ! {encoder_pars} ! video/x-h264,profile=baseline ! queue ! sink.'
                 audio_part = f'alsasrc device=plug{audio_device} ! audioresample ! audio/x-raw,rate={ar_val} ! opusenc bitrate={int(abitrate_val.rstrip("k")) * 1000} ! queue ! sink.'
@@ -176,7 +241,7 @@ def start(stream_name):
         elif video_device and not audio_device:
             # Video only - no audio
             encoder_pars = probe_hardware_encoder_pars(crf_val, gop_val, vbitrate_val)
-            video_processing = build_video_processing_chain()
+            video_processing = build_video_processing_chain(encoder_pars)
             # Streaming only
             if usewhip:
                 pipeline = f'v4l2src device={video_device} ! image/jpeg,width={width},height={height},framerate={framerate_val}/1 ! jpegdec ! {video_processing} ! {encoder_pars} ! video/x-h264,profile=baseline ! whipclientsink signaller::whip-endpoint=http://localhost:8889/{stream_name}/whip stun-server=stun://stun.l.google.com:19302 congestion-control=disabled'
@@ -185,7 +250,7 @@ def start(stream_name):
         elif audio_device and not video_device:
             # Audio with static image placeholder
             encoder_pars = probe_hardware_encoder_pars(None, gop_val, 100)  # Use low bitrate for static image
-            static_processing = build_static_video_processing_chain()
+            static_processing = build_static_video_processing_chain(encoder_pars)
             # Streaming only
             if usewhip:
                 video_part = f'multifilesrc location={static_img} loop=true ! pngdec ! imagefreeze ! videoscale ! video/x-raw,width={width},height={height} ! videorate ! video/x-raw,framerate={framerate_val}/1 ! {static_processing} ! {encoder_pars} ! video/x-h264,profile=baseline ! queue ! sink.'
@@ -199,7 +264,7 @@ def start(stream_name):
         else:
             # Neither video nor audio - static image placeholder only
             encoder_pars = probe_hardware_encoder_pars(None, gop_val, 100) # Use low bitrate for static image
-            static_processing = build_static_video_processing_chain()
+            static_processing = build_static_video_processing_chain(encoder_pars)
             if usewhip:
                 pipeline = f'multifilesrc location={static_img} loop=true ! pngdec ! imagefreeze ! videoscale ! video/x-raw,width={width},height={height} ! videorate ! video/x-raw,framerate={framerate_val}/1 ! {static_processing} ! {encoder_pars} ! video/x-h264,profile=baseline ! whipclientsink signaller::whip-endpoint=http://localhost:8889/{stream_name}/whip stun-server=stun://stun.l.google.com:19302 congestion-control=disabled'
             else:
@@ -217,11 +282,10 @@ def start(stream_name):
 
         return cmd, env
 
-    def build_ffmpeg_cmd(video_device, audio_device, framerate_val, resolution_val, crf_val, gop_val, vbitrate_val, ar_val, abitrate_val, volume_val, mirror_vertical_val, stream_name=None):
+    def build_ffmpeg_cmd(video_device, audio_device, framerate_val, resolution_val, crf_val, gop_val, vbitrate_val, ar_val, abitrate_val, volume_val, mirror_vertical_val, stabilization, stream_name=None):
         # Set hardware volume using amixer if audio_device and volume are set
         if audio_device and volume_val is not None:
-            import re
-            m = re.search(r'(?:plug)?hw:(\d+)', str(audio_device))
+            m = _HW_RE.search(str(audio_device))
             if m:
                 cardnum = m.group(1)
                 try:
@@ -233,11 +297,22 @@ def start(stream_name):
                 except Exception as e:
                     print(f"Warning: Failed to set mic volume with amixer: {e}")
 
-        # Get stabilization setting
-        stabilization = get_setting('video_stabilization')
-        
         def probe_hardware_encoder(video_opts):
-            # Try h264_v4l2m2m first (RPi hardware encoder)
+            # Reuse the verdict from an earlier probe of the same input
+            cache_key = 'ffmpeg:' + ' '.join(video_opts)
+            cached = probe_cache.get(cache_key)
+            if cached:
+                print(f"Using {'hardware' if cached == 'h264_v4l2m2m' else 'software'} encoder: {cached} (cached probe)")
+                return cached
+            
+            # The encoder needs the V4L2 M2M nodes; without them (e.g. Pi 5) skip the ffmpeg probe entirely
+            hw_devices = ['/dev/video10', '/dev/video11', '/dev/video12']
+            available_hw = [dev for dev in hw_devices if os.path.exists(dev)]
+            if not available_hw:
+                print("No hardware encoder devices found, using libx264")
+                return 'libx264'
+            
+            # Try h264_v4l2m2m (RPi hardware encoder)
             try:
                 probe_cmd = ['ffmpeg', '-hide_banner', '-loglevel', 'error'] + video_opts + [
                     '-vcodec', 'h264_v4l2m2m', 
@@ -250,20 +325,34 @@ def start(stream_name):
                 result = subprocess.run(probe_cmd, capture_output=True, text=True, timeout=10)
                 if result.returncode == 0:
                     print("Using hardware encoder: h264_v4l2m2m")
+                    cache_probe_result(cache_key, 'h264_v4l2m2m')
                     return 'h264_v4l2m2m'
             except Exception as e:
                 print(f"h264_v4l2m2m probe failed: {e}")
 
-            # Check if hardware encoder devices exist
-            hw_devices = ['/dev/video10', '/dev/video11', '/dev/video12']
-            available_hw = [dev for dev in hw_devices if os.path.exists(dev)]
-            if available_hw:
-                print(f"Hardware encoder devices found: {available_hw}, but probing failed")
-            else:
-                print("No hardware encoder devices found")
-            
+            # Probe may have failed transiently (e.g. camera still held by the previous ffmpeg), so retry next time
+            print(f"Hardware encoder devices found: {available_hw}, but probing failed")
             print("Hardware encoders not supported, falling back to libx264")
             return 'libx264'
+
+        def encoder_opts(vcodec):
+            """Return the -vcodec option plus any encoder-specific tuning"""
+            if vcodec == 'h264_v4l2m2m':
+                # Fewer queued input frames (default 16, minimum 6): less latency and DMA buffer memory
+                return ['-vcodec', vcodec, '-num_output_buffers', '6']
+            # libx264 is CPU-bound on the Pi: zerolatency already drops B-frames and lookahead, and one
+            # reference frame without weighted-P analysis trims the medium preset's motion search
+            return ['-vcodec', vcodec, '-preset', 'medium', '-tune', 'zerolatency',
+                    '-x264-params', 'ref=1:weightp=0']
+
+        def rate_control_opts(vcodec, crf_val, vbitrate_val):
+            """Return the rate-control options that apply to the selected encoder"""
+            if vcodec == 'h264_v4l2m2m' or crf_val in (None, '', 0, '0'):
+                # The hardware encoder is bitrate-controlled and ignores -crf
+                return ['-b:v', f'{vbitrate_val}k']
+            # libx264 in CRF mode ignores -b:v, so cap it with VBV instead
+            return ['-crf', str(crf_val), '-maxrate', f'{vbitrate_val}k', '-bufsize', f'{2 * int(vbitrate_val)}k']
+
         base_opts = []
         # Four cases: both present, only video, only audio, neither
         if video_device and audio_device:
@@ -281,14 +370,10 @@ def start(stream_name):
                 '-f', 'alsa',
                 '-i', f'plug{audio_device}'
             ]
-            if crf_val not in (None, '', 0, '0'):
-                base_opts += ['-crf', str(crf_val)]
             base_opts += [
-                '-vcodec', vcodec,
-                '-preset', 'medium',
+                *encoder_opts(vcodec),
                 '-pix_fmt', 'yuv420p',
-                '-b:v', f'{vbitrate_val}k',
-                '-tune', 'zerolatency',
+                *rate_control_opts(vcodec, crf_val, vbitrate_val),
                 '-g', str(gop_val),
                 '-keyint_min', '1',
                 '-acodec', 'libopus',
@@ -310,15 +395,11 @@ def start(stream_name):
                 '-f', 'lavfi',
                 '-i', f'anullsrc=r={ar_val}:cl=mono'
             ]
-            if crf_val not in (None, '', 0, '0'):
-                base_opts += ['-crf', str(crf_val)]
             base_opts += [
                 '-shortest',
-                '-vcodec', vcodec,
-                '-preset', 'medium',
+                *encoder_opts(vcodec),
                 '-pix_fmt', 'yuv420p',
-                '-b:v', f'{vbitrate_val}k',
-                '-tune', 'zerolatency',
+                *rate_control_opts(vcodec, crf_val, vbitrate_val),
                 '-g', str(gop_val),
                 '-keyint_min', '1',
                 '-acodec', 'libopus',
@@ -344,12 +425,9 @@ def start(stream_name):
             ]
             base_opts = [
                 '-shortest',
-                '-vcodec', vcodec,
-                '-preset', 'medium',
+                *encoder_opts(vcodec),
                 '-pix_fmt', 'yuv420p',
-                '-crf', str(static_crf),
-                '-b:v', f'{static_vbitrate}k',
-                '-tune', 'zerolatency',
+                *rate_control_opts(vcodec, static_crf, static_vbitrate),
                 '-g', str(static_gop),
                 '-keyint_min', '1',
                 '-acodec', 'libopus',
@@ -376,12 +454,9 @@ def start(stream_name):
             ]
             base_opts = [
                 '-shortest',
-                '-vcodec', vcodec,
-                '-preset', 'medium',
+                *encoder_opts(vcodec),
                 '-pix_fmt', 'yuv420p',
-                '-crf', str(static_crf),
-                '-b:v', f'{static_vbitrate}k',
-                '-tune', 'zerolatency',
+                *rate_control_opts(vcodec, static_crf, static_vbitrate),
                 '-g', str(static_gop),
                 '-keyint_min', '1',
                 '-acodec', 'libopus',
@@ -390,10 +465,14 @@ def start(stream_name):
             ]
         # Build video filter chain
         video_horizontal_res = int(resolution_val.split('x')[0])
-        video_filters = [f'scale={video_horizontal_res}:-2,hqdn3d=1.5:1.5:6:6'] # force scale to same width givein in resolution_val, maintain aspect ratio, apply denoise
-        if stabilization:
-            # Add deshake filter for real-time stabilization
-            video_filters.insert(0, 'deshake=x=-1:y=-1:w=-1:h=-1:rx=16:ry=16')
+        if video_device:
+            video_filters = [f'scale={video_horizontal_res}:-2,hqdn3d=1.5:1.5:6:6'] # force scale to same width givein in resolution_val, maintain aspect ratio, apply denoise
+            if stabilization:
+                # Add deshake filter for real-time stabilization
+                video_filters.insert(0, 'deshake=x=-1:y=-1:w=-1:h=-1:rx=16:ry=16')
+        else:
+            # Static placeholder image: there is no noise or shake to remove, only scale it
+            video_filters = [f'scale={video_horizontal_res}:-2']
         if mirror_vertical_val:
             # Add vertical mirror (flip) filter
             video_filters.append('vflip')
@@ -404,120 +483,236 @@ def start(stream_name):
         cmd = ['ffmpeg'] + video_opts + audio_opts + base_opts + output_opts
         return cmd, None
 
-    state = {'video': None, 'audio': None, 'proc': None, 'should_restart': False}
+    state = {'video': None, 'audio': None, 'settings': None}
     check_interval = 2
+    # With event sources available, still rescan this often in case an event was missed
+    event_rescan_interval = 60
+    # Longest time an event burst is drained before rescanning anyway
+    event_drain_limit = 2
+    # Settings that require an ffmpeg/GStreamer restart when changed
+    monitored_settings = (
+        'framerate', 'resolution', 'crf', 'gop', 'vbitrate', 'ar', 'abitrate', 'volume',
+        'use_gstreamer', 'video_stabilization', 'video_mirror_vertical'
+    )
+    # Everything needed per poll, fetched with a single settings cache check
+    polled_settings = ('video_input', 'audio_input') + monitored_settings
 
-    def monitor_devices():
-        prev_video_device = None
-        prev_audio_device = None
-        prev_settings = {
-            'framerate': get_setting('framerate'),
-            'resolution': get_setting('resolution'),
-            'crf': get_setting('crf'),
-            'gop': get_setting('gop'),
-            'vbitrate': get_setting('vbitrate'),
-            'ar': get_setting('ar'),
-            'abitrate': get_setting('abitrate'),
-            'volume': get_setting('volume'),
-            'use_gstreamer': get_setting('use_gstreamer'),
-            'video_stabilization': get_setting('video_stabilization'),
-            'video_mirror_vertical': get_setting('video_mirror_vertical')
-        }
+    def poll_current():
+        """Return (video_device, audio_device, monitored settings dict) from one settings lookup"""
+        settings = get_settings(*polled_settings)
+        video_device = find_video_device(settings['video_input'])
+        audio_device = find_usb_audio_device(settings['audio_input'])
+        return video_device, audio_device, {key: settings[key] for key in monitored_settings}
+
+    def open_event_sources():
+        """
+        Set up inotify on the settings file and a udev monitor for video4linux/sound devices.
+        Returns (fds, drain) where drain() consumes pending events and reports (settings_event, device_event),
+        or ([], None) if either source is unavailable.
+        """
+        fds = []
+        watcher = None
+        monitor = None
+        settings_dir, settings_name = os.path.split(SETTINGS_FILE)
+        # ATTRIB fires on the old inode when save_settings() renames a new file over it
+        file_mask = (inotify_flags.CLOSE_WRITE | inotify_flags.ATTRIB |
+                     inotify_flags.DELETE_SELF | inotify_flags.MOVE_SELF)
+        dir_watch = {'wd': None}
+
+        def arm_settings_watch():
+            """
+            Watch settings.json itself; re-armed after every event since saves replace the file.
+            While the file does not exist yet, watch its directory for it to appear instead.
+            """
+            try:
+                watcher.add_watch(SETTINGS_FILE, file_mask)
+            except FileNotFoundError:
+                if dir_watch['wd'] is None:
+                    dir_watch['wd'] = watcher.add_watch(settings_dir, inotify_flags.CREATE | inotify_flags.MOVED_TO)
+                return
+            if dir_watch['wd'] is not None:
+                try:
+                    watcher.rm_watch(dir_watch['wd'])
+                except OSError:
+                    pass
+                dir_watch['wd'] = None
+
+        if INotify is not None:
+            try:
+                watcher = INotify()
+                arm_settings_watch()
+                fds.append(watcher.fileno())
+            except OSError as e:
+                print(f"inotify unavailable for settings, falling back to polling: {e}")
+                return [], None
+        if pyudev is not None:
+            try:
+                monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+                monitor.filter_by('video4linux')
+                monitor.filter_by('sound')
+                monitor.start()
+                fds.append(monitor.fileno())
+            except Exception as e:
+                print(f"udev monitor unavailable, falling back to polling: {e}")
+                return [], None
+        # Both sources are needed; otherwise settings or devices would still have to be polled
+        if watcher is None or monitor is None:
+            return [], None
+
+        def drain():
+            settings_event = False
+            for event in watcher.read(timeout=0):
+                # IGNORED only reports that the watch on a replaced inode went away;
+                # directory events matter only for settings.json itself
+                if event.mask == inotify_flags.IGNORED or (event.name and event.name != settings_name):
+                    continue
+                settings_event = True
+            if settings_event:
+                try:
+                    arm_settings_watch()
+                except OSError as e:
+                    print(f"Could not re-arm settings watch: {e}")
+            device_event = False
+            while monitor.poll(timeout=0) is not None:
+                device_event = True
+            return settings_event, device_event
+
+        return fds, drain
+
+    def open_pidfd(proc):
+        """Return a pollable fd that becomes readable when proc exits (Linux 5.3+), or None"""
+        try:
+            return os.pidfd_open(proc.pid)
+        except (AttributeError, OSError):
+            return None
+
+    def refresh_device_lists():
+        """Drop the device lists cached in utils so the next scan sees hotplugged devices"""
+        list_video_inputs.cache_clear()
+        list_audio_inputs.cache_clear()
+
+    def wait_for_events(fds, drain, proc_fd):
+        """
+        Block until a settings/device event arrives, the pipeline process exits or the timeout passes.
+        Returns True if devices and settings should be rescanned.
+        Event bursts are drained until they go quiet (at most event_drain_limit seconds), so one hotplug
+        leads to one rescan; the pipeline exiting ends the wait immediately.
+        """
+        watch = fds + [proc_fd] if proc_fd is not None else fds
+        # Without event sources (or a pidfd to notice the process exiting) fall back to periodic checks
+        timeout = event_rescan_interval if fds and proc_fd is not None else check_interval
+        ready, _, _ = select.select(watch, [], [], timeout)
+        if not ready:
+            # Periodic rescan (the only way to see hotplugs when polling), so bypass the cached lists
+            refresh_device_lists()
+            return True
+        # Plugging a device produces a burst of udev events; keep draining until it goes quiet
+        settings_event = device_event = False
+        deadline = time.monotonic() + event_drain_limit
+        while ready and proc_fd not in ready:
+            settings_changed, devices_changed = drain()
+            settings_event = settings_event or settings_changed
+            device_event = device_event or devices_changed
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            ready, _, _ = select.select(watch, [], [], min(0.5, remaining))
+        if device_event:
+            # The device lists are cached in utils; they only change on hotplug, so refresh them now
+            refresh_device_lists()
+        return settings_event or device_event
+
+    def check_for_changes():
+        """Rescan devices and settings into state; return True if the pipeline needs a restart"""
+        prev_settings = state['settings']
+        video_device, audio_device, current_settings = poll_current()
         
-        while True:
-            video_device = find_video_device()
-            audio_device = find_usb_audio_device()
-            
-            # Check for current settings
-            current_settings = {
-                'framerate': get_setting('framerate'),
-                'resolution': get_setting('resolution'),
-                'crf': get_setting('crf'),
-                'gop': get_setting('gop'),
-                'vbitrate': get_setting('vbitrate'),
-                'ar': get_setting('ar'),
-                'abitrate': get_setting('abitrate'),
-                'volume': get_setting('volume'),
-                'use_gstreamer': get_setting('use_gstreamer'),
-                'video_stabilization': get_setting('video_stabilization'),
-                'video_mirror_vertical': get_setting('video_mirror_vertical')
-            }
-            
-            # Check for device changes
-            device_changed = (video_device != prev_video_device or audio_device != prev_audio_device)
-            
-            # Check for settings changes
-            settings_changed = current_settings != prev_settings
-            
-            if device_changed or settings_changed:
-                if device_changed:
-                    print(f"Device change detected. Video: {video_device}, Audio: {audio_device}")
-                if settings_changed:
-                    changed_settings = [k for k in current_settings if current_settings[k] != prev_settings[k]]
-                    print(f"Settings change detected: {changed_settings}")
-                    print(f"Previous: {[(k, prev_settings[k]) for k in changed_settings]}")
-                    print(f"Current: {[(k, current_settings[k]) for k in changed_settings]}")
-                
-                state['should_restart'] = True
-                if state['proc'] and state['proc'].poll() is None:
-                    state['proc'].terminate()
-                    
-            prev_video_device = video_device
-            prev_audio_device = audio_device
-            prev_settings = current_settings.copy()
-            time.sleep(check_interval)
+        # Check for device changes
+        device_changed = (video_device != state['video'] or audio_device != state['audio'])
+        
+        # Check for settings changes
+        settings_changed = current_settings != prev_settings
+        
+        if device_changed:
+            print(f"Device change detected. Video: {video_device}, Audio: {audio_device}")
+        if settings_changed:
+            changed_settings = [k for k in current_settings if current_settings[k] != prev_settings[k]]
+            print(f"Settings change detected: {changed_settings}")
+            print(f"Previous: {[(k, prev_settings[k]) for k in changed_settings]}")
+            print(f"Current: {[(k, current_settings[k]) for k in changed_settings]}")
+        
+        state['video'] = video_device
+        state['audio'] = audio_device
+        state['settings'] = current_settings
+        return device_changed or settings_changed
+
+    fds, drain = open_event_sources()
+    if fds:
+        print("Watching settings and device hotplug events")
 
-    # Start monitoring thread
-    t = threading.Thread(target=monitor_devices, daemon=True)
-    t.start()
+    # Initial device and settings scan; check_for_changes() keeps state current from here on
+    state['video'], state['audio'], state['settings'] = poll_current()
 
+    # Single event loop: run the pipeline and wait on its pidfd together with the settings/udev events
     while True:
-        # Get current settings each iteration
-        current_framerate = get_setting('framerate')
-        current_resolution = get_setting('resolution')
-        current_crf = get_setting('crf')
-        current_gop = get_setting('gop')
-        current_vbitrate = get_setting('vbitrate')
-        current_ar = get_setting('ar')
-        current_abitrate = get_setting('abitrate')
-        current_volume = get_setting('volume')
-        current_mirror_vertical = get_setting('video_mirror_vertical')
-
-        video_device = find_video_device()
-        audio_device = find_usb_audio_device()
+        current = state['settings']
+        video_device = state['video']
+        audio_device = state['audio']
+        current_framerate = current['framerate']
+        current_resolution = current['resolution']
+        current_crf = current['crf']
+        current_gop = current['gop']
+        current_vbitrate = current['vbitrate']
+        current_ar = current['ar']
+        current_abitrate = current['abitrate']
+        current_volume = current['volume']
+        current_mirror_vertical = current['video_mirror_vertical']
+        current_stabilization = current['video_stabilization']
 
         # Get streaming engine preference
-        use_gstreamer = get_setting('use_gstreamer')
+        use_gstreamer = current['use_gstreamer']
 
         # Build command with current settings using selected engine
         if use_gstreamer:
             cmd, env = build_gstreamer_cmd(
                 video_device, audio_device, current_framerate, current_resolution,
                 current_crf, current_gop, current_vbitrate, current_ar,
-                current_abitrate, current_volume, current_mirror_vertical, stream_name
+                current_abitrate, current_volume, current_mirror_vertical, current_stabilization, stream_name
             )
             print("Using GStreamer pipeline")
         else:
             cmd, env = build_ffmpeg_cmd(
                 video_device, audio_device, current_framerate, current_resolution,
                 current_crf, current_gop, current_vbitrate, current_ar,
-                current_abitrate, current_volume, current_mirror_vertical, stream_name
+                current_abitrate, current_volume, current_mirror_vertical, current_stabilization, stream_name
             )
             print("Using FFmpeg pipeline")
         
-        print("Running:", ' '.join(str(x) for x in cmd))
+        print("Running:", shlex.join(cmd))
         proc = subprocess.Popen(cmd, env=env)
-        state['proc'] = proc
+        proc_fd = open_pidfd(proc)
+        should_restart = False
+        try:
+            while proc.poll() is None:
+                rescan = wait_for_events(fds, drain, proc_fd)
+                if proc.poll() is not None:
+                    break
+                if rescan and check_for_changes():
+                    should_restart = True
+                    proc.terminate()
+                    proc.wait()
+        finally:
+            if proc_fd is not None:
+                os.close(proc_fd)
 
-        proc.wait()
-
-        if not state['should_restart']:
+        if not should_restart:
             print(f"ffmpeg exited with code {proc.returncode}. Restarting in {check_interval} seconds...")
             time.sleep(check_interval)
+            # Pick up anything that changed while the pipeline was down
+            refresh_device_lists()
+            check_for_changes()
         else:
             print("Restarting ffmpeg due to device or settings change...")
-        state['should_restart'] = False
-
 
 def main():
     stream_name = sys.argv[1] if len(sys.argv) > 1 else None